@@ -1,8 +1,9 @@
+import signal
 import subprocess
 import sys
-import time
 import threading
 from screen_mirror_controller import ScreenMirrorController
+from phone_controller import configure_logging
 
 def monitor_scrcpy_and_mirror(master_device: str, slave_devices: list):
     """Monitor scrcpy window and mirror actions"""
@@ -13,11 +14,17 @@ def monitor_scrcpy_and_mirror(master_device: str, slave_devices: list):
     print("Note: Full automatic mirroring requires scrcpy control API.")
     print("For now, use manual mirror functions or control via ADB commands.")
     
+    # Block until Ctrl+C (KeyboardInterrupt) or SIGTERM (sets stop_event) instead of waking up every second.
+    # Windows only runs signal handlers between waits, so there we still wake once a second.
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
     try:
-        while True:
-            time.sleep(1)
+        while not stop_event.wait(1 if sys.platform == 'win32' else None):
+            pass
     except KeyboardInterrupt:
-        print("\nStopping...")
+        pass
+    print("\nStopping...")
+    controller.close()
 
 
 if __name__ == "__main__":
@@ -26,6 +33,7 @@ if __name__ == "__main__":
         print("Example: py input_mirror_auto.py 192.168.1.100:5555 192.168.1.101:5555,192.168.1.102:5555")
         sys.exit(1)
     
+    configure_logging()
     master = sys.argv[1]
     slaves = sys.argv[2].split(',')
     
@@ -1,9 +1,17 @@
 from wifi_connection import WiFiADBManager
 from screen_mirror_controller import MasterSlaveController
+from phone_controller import configure_logging
+import importlib.util
+import logging
+import signal
+import threading
 import time
 import sys
 
 def main():
+    # --verbose shows the per-event [DEBUG] coordinate output
+    configure_logging(logging.DEBUG if '--verbose' in sys.argv[1:] else logging.INFO)
+    
     print("=" * 60)
     print("  Multi-Phone WiFi Control System")
     print("=" * 60)
@@ -74,12 +82,10 @@ def main():
     print("Step 3: Checking Dependencies")
     print("-" * 60)
     
-    try:
-        import pynput
-        import win32gui
-        deps_ok = True
-    except ImportError:
-        deps_ok = False
+    # Only check that the packages exist - the mirror code imports them when it needs them
+    deps_ok = (importlib.util.find_spec('pynput') is not None
+               and importlib.util.find_spec('win32gui') is not None)
+    if not deps_ok:
         print("[WARNING] Required dependencies not installed!")
         print("For automatic input mirroring, please install:")
         print("  pip install pynput pywin32")
@@ -109,14 +115,24 @@ def main():
                 print("Install pynput and pywin32 for automatic mirroring")
             print("\nPress Ctrl+C to stop...")
             
-            # Keep running
-            while True:
-                time.sleep(1)
+            # Keep running - block until Ctrl+C (KeyboardInterrupt) or SIGTERM (sets stop_event)
+            # instead of waking up every second. Windows only runs signal handlers between waits,
+            # so there we still wake once a second.
+            stop_event = threading.Event()
+            signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+            while not stop_event.wait(1 if sys.platform == 'win32' else None):
+                pass
+            stop_controller(controller)
                 
     except KeyboardInterrupt:
-        print("\n\nStopping...")
-        controller.stop()
-        print("Done!")
+        stop_controller(controller)
+
+
+def stop_controller(controller: MasterSlaveController):
+    """Shut the system down after Ctrl+C / SIGTERM"""
+    print("\n\nStopping...")
+    controller.stop()
+    print("Done!")
 
 
 if __name__ == "__main__":
@@ -1,173 +1,936 @@
 import subprocess
+import atexit
 import json
+import logging
+import os
+import sys
+import queue
+import shlex
+import socket
+from collections import deque
+import re
+import threading
 import time
-from typing import List, Dict, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger(__name__)
+
+# Marker echoed after every command so we know where its output ends
+_SENTINEL = '__DONE__'
+_SENTINEL_RE = re.compile(rb'__DONE__(\d+)\s*$')
+# Separates the outputs of several commands batched into one roundtrip
+_SEP = '___SEP___'
+# Per-device backlog of queued fire-and-forget commands before the oldest is dropped
+_SEND_QUEUE_SIZE = 16
+
+# Linux input event codes used to inject touches with sendevent
+_EV_SYN = 0
+_EV_KEY = 1
+_EV_ABS = 3
+_BTN_TOUCH = 330
+_ABS_MT_POSITION_X = 53
+_ABS_MT_POSITION_Y = 54
+_ABS_MT_TRACKING_ID = 57
+# `getevent -pl` output: "add device 3: /dev/input/event2" / "ABS_MT_POSITION_X : value 0, min 0, max 1079, ..."
+_GETEVENT_DEVICE_RE = re.compile(r'^add device \d+:\s*(\S+)')
+_GETEVENT_AXIS_RE = re.compile(r'(ABS_MT_POSITION_[XY])\s*:.*\bmin (-?\d+),\s*max (-?\d+)')
+# `dumpsys input` display rotation (0-3, quarter turns from the natural orientation)
+_SURFACE_ORIENTATION_RE = re.compile(r'SurfaceOrientation:\s*(\d)')
+# How long a known rotation is served before a background refresh is started
+_ROTATION_TTL = 2.0
+_ROTATION_COMMAND = 'dumpsys input | grep -m1 SurfaceOrientation'
+
+# Screen size parsing (`wm size` / `dumpsys window displays`)
+_RE_OVERRIDE = re.compile(r'Override size:\s*(\d+)\s*x\s*(\d+)', re.IGNORECASE)
+_RE_PHYSICAL = re.compile(r'Physical size:\s*(\d+)\s*x\s*(\d+)', re.IGNORECASE)
+_RE_ANYSIZE = re.compile(r'(\d+)\s*x\s*(\d+)', re.IGNORECASE)
+_RE_DW = re.compile(r'mDisplayWidth=(\d+)')
+_RE_DH = re.compile(r'mDisplayHeight=(\d+)')
+
+# `adb devices -l` line: "<serial>  device usb:1-1 product:redfin model:Pixel_5 device:redfin transport_id:1"
+_DEVICE_LINE_RE = re.compile(r'^(\S+)\s+device(?:\s+(.*))?$')
+
+# `input text` reads %s as a space; everything else is protected by shell quoting
+_INPUT_TEXT_TABLE = str.maketrans({' ': '%s'})
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+class AdbServerError(Exception):
+    """The adb server was reached but refused a request (e.g. `device offline`)"""
+
+
+class AdbProtocolClient:
+    """Minimal client for the adb server's host protocol - the same socket the adb CLI talks to"""
+
+    def __init__(self, host: str = '127.0.0.1', port: Optional[int] = None, timeout: float = 10.0):
+        self.host = host
+        self.port = port or int(os.environ.get('ANDROID_ADB_SERVER_PORT', 5037))
+        self.timeout = timeout
+
+    @staticmethod
+    def _recv_exact(sock: socket.socket, size: int) -> bytes:
+        data = b''
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionError('adb server closed the connection')
+            data += chunk
+        return data
+
+    def _request(self, sock: socket.socket, request: str):
+        """Send a length-prefixed request and wait for OKAY"""
+        payload = request.encode('utf-8')
+        sock.sendall(b'%04x' % len(payload) + payload)
+        status = self._recv_exact(sock, 4)
+        if status == b'OKAY':
+            return
+        if status == b'FAIL':
+            length = int(self._recv_exact(sock, 4), 16)
+            raise AdbServerError(self._recv_exact(sock, length).decode('utf-8', 'replace'))
+        raise AdbServerError(f'unexpected adb server reply {status!r}')
+
+    def open_service(self, device_id: str, service: str) -> socket.socket:
+        """Open a service (e.g. 'exec:sh') on a device; the returned socket carries its raw stream"""
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        try:
+            self._request(sock, f'host:transport:{device_id}')
+            self._request(sock, service)
+        except BaseException:
+            sock.close()
+            raise
+        sock.settimeout(None)  # The stream itself is read by a blocking reader thread
+        return sock
+
+
+class _AdbShell:
+    """Long-lived `adb shell` session - commands are written to its stdin instead of forking adb each time"""
+
+    def __init__(self, device_id: str):
+        self.device_id = device_id
+        self.process = subprocess.Popen(
+            ['adb', '-s', device_id, 'shell'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        self._start_reader(self.process.stdout)
+
+    def _start_reader(self, stream):
+        # Background reader so a chatty command can never fill the pipe and stall the shell
+        self._eof = False
+        self._lines = queue.Queue()
+        self._reader = threading.Thread(target=self._read_output, args=(stream,), daemon=True)
+        self._reader.start()
+
+    def _read_output(self, stream):
+        try:
+            for line in stream:
+                self._lines.put(line)
+        except (OSError, ValueError):
+            pass
+        self._eof = True
+        self._lines.put(None)  # EOF - shell has exited
+
+    def _write(self, data: bytes):
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def run(self, command: str, timeout: float) -> Tuple[int, bytes]:
+        """Run command, return (exit code, raw output)"""
+        # Brace group keeps `cmd &` style commands valid and stops the command from eating our stdin
+        self._write(f'{{ {command}\n}} </dev/null; echo {_SENTINEL}$?\n'.encode('utf-8'))
+        
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining <= 0:
+                    raise queue.Empty
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(command, timeout)
+            if line is None:
+                raise BrokenPipeError(f'adb shell for {self.device_id} closed')
+            match = _SENTINEL_RE.search(line)
+            if match:
+                # Output without a trailing newline ends up on the sentinel line
+                output.append(line[:match.start()])
+                return int(match.group(1)), b''.join(output)
+            output.append(line)
+
+    def send(self, command: str):
+        """Write command without waiting for it (output discarded; later commands still run after it)"""
+        self._write(f'{{ {command}\n}} </dev/null >/dev/null 2>&1\n'.encode('utf-8'))
+
+    def close(self):
+        try:
+            self.process.stdin.write(b'exit\n')
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass
+        try:
+            self.process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class _AdbSocketShell(_AdbShell):
+    """Persistent `sh` on the device over a direct adb server socket - no adb client process at all"""
+
+    def __init__(self, device_id: str, client: AdbProtocolClient):
+        self.device_id = device_id
+        # exec: gives a raw (no pty, no echo) stream, like `adb shell` with piped stdin
+        self._sock = client.open_service(device_id, 'exec:sh')
+        self._start_reader(self._sock.makefile('rb'))
+
+    def _write(self, data: bytes):
+        self._sock.sendall(data)
+
+    def is_alive(self) -> bool:
+        return not self._eof
+
+    def close(self):
+        try:
+            self._sock.sendall(b'exit\n')
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+class _TouchDevice:
+    """Touchscreen input node of a device - builds sendevent sequences that bypass the `input` JVM"""
+
+    def __init__(self, node: str, min_x: int, max_x: int, min_y: int, max_y: int, has_btn_touch: bool):
+        self.node = node
+        self.min_x = min_x
+        self.max_x = max_x
+        self.min_y = min_y
+        self.max_y = max_y
+        # Touch-down / lift-off sequences never change, so build them once
+        sync = f'sendevent {node} {_EV_SYN} 0 0'
+        down = [f'sendevent {node} {_EV_ABS} {_ABS_MT_TRACKING_ID} 0']
+        up = [f'sendevent {node} {_EV_ABS} {_ABS_MT_TRACKING_ID} -1']
+        if has_btn_touch:
+            down.append(f'sendevent {node} {_EV_KEY} {_BTN_TOUCH} 1')
+            up.append(f'sendevent {node} {_EV_KEY} {_BTN_TOUCH} 0')
+        up.append(sync)
+        self._sync = sync
+        self._down = '; '.join(down)
+        self._up = '; '.join(up)
+
+    def _move(self, x: int, y: int) -> str:
+        return (f'sendevent {self.node} {_EV_ABS} {_ABS_MT_POSITION_X} {x}; '
+                f'sendevent {self.node} {_EV_ABS} {_ABS_MT_POSITION_Y} {y}; {self._sync}')
+
+    def to_raw(self, x: int, y: int, screen: Dict, rotation: int) -> Tuple[int, int]:
+        """Map rotation-relative `input` coordinates to the touch panel's axis range
+        
+        The panel axes and `wm size` are both in the natural orientation, so the point is rotated back first.
+        """
+        width, height = screen['width'], screen['height']
+        if rotation == 1:
+            x, y = width - 1 - y, x
+        elif rotation == 2:
+            x, y = width - 1 - x, height - 1 - y
+        elif rotation == 3:
+            x, y = y, height - 1 - x
+        raw_x = self.min_x + x * (self.max_x - self.min_x + 1) // width
+        raw_y = self.min_y + y * (self.max_y - self.min_y + 1) // height
+        return max(self.min_x, min(self.max_x, raw_x)), max(self.min_y, min(self.max_y, raw_y))
+
+    def to_screen(self, raw_x: int, raw_y: int, screen: Dict, rotation: int) -> Tuple[int, int]:
+        """Map a touch panel point to rotation-relative `input` coordinates (inverse of to_raw)"""
+        width, height = screen['width'], screen['height']
+        x = max(0, min(width - 1, (raw_x - self.min_x) * width // (self.max_x - self.min_x + 1)))
+        y = max(0, min(height - 1, (raw_y - self.min_y) * height // (self.max_y - self.min_y + 1)))
+        if rotation == 1:
+            return y, width - 1 - x
+        if rotation == 2:
+            return width - 1 - x, height - 1 - y
+        if rotation == 3:
+            return height - 1 - y, x
+        return x, y
+
+    def tap_command(self, x: int, y: int) -> str:
+        return f'{self._down}; {self._move(x, y)}; {self._up}'
+
+    def swipe_command(self, x1: int, y1: int, x2: int, y2: int, duration: int) -> str:
+        # One move roughly every 16ms (a frame), capped so the command line stays short
+        steps = max(1, min(30, duration // 16))
+        pause = duration / 1000 / steps
+        parts = [self._down, self._move(x1, y1)]
+        for i in range(1, steps + 1):
+            parts.append(f'sleep {pause:.3f}')
+            parts.append(self._move(x1 + (x2 - x1) * i // steps, y1 + (y2 - y1) * i // steps))
+        parts.append(self._up)
+        return '; '.join(parts)
+
+
+class _FrameStream:
+    """Persistent screencap loop on the device - each frame is one pipe roundtrip instead of a new adb pipeline"""
+
+    def __init__(self, device_id: str):
+        self.device_id = device_id
+        # Every line we write asks the device for one fresh PNG
+        self.process = subprocess.Popen(
+            ['adb', '-s', device_id, 'shell', 'while read _; do screencap -p; done'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.lock = threading.Lock()
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self.process.stdout.read(size)
+        if len(data) < size:
+            raise EOFError(f'frame stream for {self.device_id} closed')
+        return data
+
+    def read_frame(self) -> bytes:
+        """Request a frame and return the PNG bytes"""
+        with self.lock:
+            self.process.stdin.write(b'\n')
+            self.process.stdin.flush()
+            # PNGs are self-delimiting: walk the chunks up to IEND
+            signature = self._read_exact(8)
+            if signature != _PNG_SIGNATURE:
+                raise ValueError(f'unexpected frame data from {self.device_id}')
+            parts = [signature]
+            while True:
+                header = self._read_exact(8)
+                length = int.from_bytes(header[:4], 'big')
+                parts.append(header)
+                parts.append(self._read_exact(length + 4))  # chunk data + CRC
+                if header[4:] == b'IEND':
+                    return b''.join(parts)
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Plain message for INFO, "[LEVEL] message" otherwise - the same look as the scripts' own prints"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        return message if record.levelno == logging.INFO else f'[{record.levelname}] {message}'
+
+
+def configure_logging(level: int = logging.INFO) -> QueueListener:
+    """Log through a queue so the calling thread never blocks on console IO (a listener thread writes it out)
+    
+    PhoneController and ScreenMirrorController report everything through logging, so call this first
+    (scripts and the REPL alike) to see their output.
+    """
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(_ConsoleFormatter('%(message)s'))
+    listener = QueueListener(log_queue, console)
+    logging.basicConfig(level=level, format='%(message)s', handlers=[QueueHandler(log_queue)])
+    listener.start()
+    # Flushes whatever is still queued on exit
+    atexit.register(listener.stop)
+    return listener
+
+
+def _decode(data: bytes) -> str:
+    """Decode shell output the way text-mode pipes did (UTF-8, universal newlines)"""
+    return data.decode('utf-8', 'replace').replace('\r\n', '\n')
+
 
 class PhoneController:
-    def __init__(self):
+    # The adb server is process-wide, so it only needs starting once
+    _server_started = False
+    
+    def __init__(self, adb_timeout: float = 10.0, prefetch_info: bool = False):
+        """prefetch_info: have scan_devices start fetching get_device_info() for new devices in the background"""
         self.devices = []
+        self.adb_timeout = adb_timeout
+        self.prefetch_info = prefetch_info
+        self._adb_client = AdbProtocolClient(timeout=adb_timeout)
+        self._start_server()
+        self._shells: Dict[str, _AdbShell] = {}
+        self._shell_locks: Dict[str, threading.Lock] = {}
+        self._shell_locks_guard = threading.Lock()
+        # TTL cache for query results that rarely change: key -> (timestamp, value)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        # Pool workers read and fill the cache concurrently (fn itself runs outside the lock)
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Device info prefetched in the background by scan_devices (if prefetch_info): device_id -> Future
+        self._info_cache: Dict[str, Future] = {}
+        # Worker pool shared by all *_all fan-outs (sized by scan_devices)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_size = 0
+        # Touchscreen node per device for sendevent input (None = not usable, use `input`)
+        self._touch_devices: Dict[str, Optional[_TouchDevice]] = {}
+        # Recent fire-and-forget commands, so callers can drain them with wait_async()
+        self._async_futures = deque(maxlen=256)
+        # Per-device queue + writer thread for queue_command, so one stalled shell can't hold up the others
+        self._send_queues: Dict[str, queue.Queue] = {}
+        self._send_threads: List[threading.Thread] = []
+        # Last write error per device from its writer thread, cleared by the next successful write
+        self._send_errors: Dict[str, str] = {}
+        self._frame_streams: Dict[str, _FrameStream] = {}
+        # Extra fields reported by `adb devices -l` (model, product, device, ...)
+        self._device_meta: Dict[str, Dict[str, str]] = {}
+        # Devices with a background rotation refresh in flight
+        self._rotation_refreshes: set = set()
+        # Writer threads are daemons, so flush their queues at exit even if close() is never called
+        atexit.register(self.close)
         self.scan_devices()
     
+    def _cached(self, key: str, ttl: float, fn: Callable[[], Any]) -> Any:
+        """Return cached value for key if younger than ttl seconds, otherwise call fn and cache it"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                self._cache_hits += 1
+                return entry[1]
+            self._cache_misses += 1
+        value = fn()
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+    
+    def invalidate(self, key_prefix: str = ''):
+        """Drop cached entries whose key starts with key_prefix (everything by default)"""
+        with self._cache_lock:
+            for key in [k for k in self._cache if k.startswith(key_prefix)]:
+                del self._cache[key]
+    
+    def _run_adb(self, args: List[str], timeout: Optional[float] = None, **kwargs) -> subprocess.CompletedProcess:
+        """Run a one-off adb command with a timeout (self.adb_timeout unless given)"""
+        return subprocess.run(['adb', *args], timeout=timeout or self.adb_timeout, **kwargs)
+    
+    def _start_server(self):
+        """Start the adb server up front instead of on the first `adb devices` (never restarts it)"""
+        if PhoneController._server_started:
+            return
+        try:
+            self._run_adb(['start-server'], capture_output=True, check=False)
+            PhoneController._server_started = True
+        except Exception as e:
+            logger.warning("Could not start adb server: %s", e)
+    
     def scan_devices(self):
-        """Scan for all connected Android devices"""
+        """Scan for all connected Android devices (result cached for 5s)"""
         try:
-            result = subprocess.run(
-                ['adb', 'devices'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header
-            self.devices = []
-            for line in lines:
-                if line.strip() and '\tdevice' in line:
-                    device_id = line.split('\t')[0]
-                    self.devices.append(device_id)
-            print(f"Found {len(self.devices)} device(s): {self.devices}")
-            return self.devices
+            self.devices = list(self._cached('devices', 5.0, self._list_devices))
         except Exception as e:
-            print(f"Error scanning devices: {e}")
+            logger.warning("Error scanning devices: %s", e)
             return []
+        self._resize_pool()
+        if self.prefetch_info:
+            self._prefetch_device_info()
+        return self.devices
     
-    def execute_command(self, device_id: str, command: str) -> Dict:
-        """Execute ADB command on specific device"""
+    def _resize_pool(self):
+        """(Re)create the shared worker pool when the device count changes"""
+        size = max(1, len(self.devices))
+        if self._pool is None or self._pool_size != size:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+            self._pool = ThreadPoolExecutor(max_workers=size, thread_name_prefix='adb')
+            self._pool_size = size
+    
+    def _prefetch_device_info(self):
+        """Start fetching device info for newly seen devices so the first query is already answered"""
+        new_devices = [d for d in self.devices if d not in self._info_cache]
+        if not new_devices:
+            return
+        for device_id in new_devices:
+            self._info_cache[device_id] = self._pool.submit(self._fetch_device_info, device_id)
+    
+    def _list_devices(self) -> List[str]:
+        """Run `adb devices -l` and return the ids of ready devices (their metadata goes to _device_meta)"""
+        result = self._run_adb(
+            ['devices', '-l'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        lines = result.stdout.splitlines()[1:]  # Skip header
+        devices = []
+        for line in lines:
+            match = _DEVICE_LINE_RE.match(line.strip())
+            if match:
+                device_id = match.group(1)
+                devices.append(device_id)
+                meta = {}
+                for token in (match.group(2) or '').split():
+                    key, sep, value = token.partition(':')
+                    if sep:
+                        meta[key] = value
+                self._device_meta[device_id] = meta
+        logger.info("Found %d device(s): %s", len(devices), devices)
+        return devices
+    
+    def _get_shell_lock(self, device_id: str) -> threading.Lock:
+        """Get the lock serializing commands on a device's shell"""
+        with self._shell_locks_guard:
+            lock = self._shell_locks.get(device_id)
+            if lock is None:
+                lock = self._shell_locks[device_id] = threading.Lock()
+            return lock
+    
+    def _get_shell(self, device_id: str) -> _AdbShell:
+        """Get the persistent shell for a device, spawning it on first use"""
+        shell = self._shells.get(device_id)
+        if shell is None or not shell.is_alive():
+            shell = self._shells[device_id] = self._open_shell(device_id)
+        return shell
+    
+    def _open_shell(self, device_id: str) -> _AdbShell:
+        """Open a shell straight over the adb server socket, or through the adb CLI if the server can't be reached
+        
+        A refusal from the server itself (device not found / offline) raises AdbServerError - the CLI would only
+        get the same answer, slower.
+        """
         try:
-            result = subprocess.run(
-                ['adb', '-s', device_id, 'shell', command],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            return {
-                'device_id': device_id,
-                'success': result.returncode == 0,
-                'output': result.stdout,
-                'error': result.stderr
-            }
-        except subprocess.TimeoutExpired:
-            return {
-                'device_id': device_id,
-                'success': False,
-                'error': 'Command timeout'
-            }
-        except Exception as e:
-            return {
-                'device_id': device_id,
-                'success': False,
-                'error': str(e)
-            }
+            return _AdbSocketShell(device_id, self._adb_client)
+        except OSError as e:
+            logger.debug("adb socket shell for %s unavailable (%s), using adb CLI", device_id, e)
+        return _AdbShell(device_id)
+    
+    def _drop_shell(self, device_id: str):
+        """Close and forget a device's shell (it will be respawned on next use)"""
+        shell = self._shells.pop(device_id, None)
+        if shell:
+            shell.close()
+    
+    def execute_command(self, device_id: str, command: str, decode: bool = True) -> Dict:
+        """Execute ADB command on specific device (raw output in 'output_bytes'; decode=False skips 'output')"""
+        with self._get_shell_lock(device_id):
+            try:
+                try:
+                    returncode, output = self._get_shell(device_id).run(command, timeout=30)
+                except OSError as e:
+                    # Broken pipe / shell died (device reconnected etc.) - respawn once
+                    logger.debug("adb shell for %s lost (%s), respawning", device_id, e)
+                    self._drop_shell(device_id)
+                    self.invalidate('devices')
+                    returncode, output = self._get_shell(device_id).run(command, timeout=30)
+                result = {
+                    'device_id': device_id,
+                    'success': returncode == 0,
+                    'output_bytes': output,
+                    'error': '' if returncode == 0 else _decode(output)
+                }
+                if decode:
+                    result['output'] = _decode(output)
+                return result
+            except subprocess.TimeoutExpired:
+                # Shell state is unknown after a timeout, start fresh next time
+                logger.debug("Command timed out on %s: %s", device_id, command)
+                self._drop_shell(device_id)
+                return {
+                    'device_id': device_id,
+                    'success': False,
+                    'error': 'Command timeout'
+                }
+            except Exception as e:
+                logger.debug("Command failed on %s: %s", device_id, e)
+                self._drop_shell(device_id)
+                return {
+                    'device_id': device_id,
+                    'success': False,
+                    'error': str(e)
+                }
+    
+    def send_command(self, device_id: str, command: str) -> Dict:
+        """Write a command to the device's persistent shell without waiting for it (fire-and-forget input)"""
+        with self._get_shell_lock(device_id):
+            try:
+                try:
+                    self._get_shell(device_id).send(command)
+                except OSError as e:
+                    # Broken pipe / shell died (device reconnected etc.) - respawn once
+                    logger.debug("adb shell for %s lost (%s), respawning", device_id, e)
+                    self._drop_shell(device_id)
+                    self.invalidate('devices')
+                    self._get_shell(device_id).send(command)
+                return {
+                    'device_id': device_id,
+                    'success': True,
+                    'error': ''
+                }
+            except Exception as e:
+                logger.debug("Command failed on %s: %s", device_id, e)
+                self._drop_shell(device_id)
+                return {
+                    'device_id': device_id,
+                    'success': False,
+                    'error': str(e)
+                }
+    
+    def queue_command(self, device_id: str, command: str) -> Dict:
+        """Queue a fire-and-forget command for the device's writer thread (drops its oldest queued command if full)
+        
+        Reports failure while the device's last queued write failed, so callers notice a dead device.
+        """
+        with self._shell_locks_guard:
+            send_queue = self._send_queues.get(device_id)
+            if send_queue is None:
+                send_queue = self._send_queues[device_id] = queue.Queue(maxsize=_SEND_QUEUE_SIZE)
+                thread = threading.Thread(target=self._send_loop, args=(device_id, send_queue), daemon=True)
+                thread.start()
+                self._send_threads.append(thread)
+        dropped = self._put_dropping_oldest(send_queue, command)
+        if dropped:
+            logger.warning("Send queue for %s full, dropped: %s", device_id, dropped)
+        error = self._send_errors.get(device_id)
+        return {
+            'device_id': device_id,
+            'success': error is None,
+            'error': error or ''
+        }
+    
+    @staticmethod
+    def _put_dropping_oldest(send_queue: queue.Queue, item) -> Optional[str]:
+        """Put item without blocking, evicting the oldest entry if needed; returns the evicted command"""
+        dropped = None
+        while True:
+            try:
+                send_queue.put_nowait(item)
+                return dropped
+            except queue.Full:
+                try:
+                    dropped = send_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _send_loop(self, device_id: str, send_queue: queue.Queue):
+        """Writer thread: pass queued commands to the device's shell in order until None arrives"""
+        while True:
+            command = send_queue.get()
+            if command is None:
+                return
+            result = self.send_command(device_id, command)
+            if result['success']:
+                self._send_errors.pop(device_id, None)
+            else:
+                self._send_errors[device_id] = result['error']
+                logger.warning("Queued command failed on %s: %s", device_id, result['error'])
+    
+    def close(self):
+        """Close all persistent adb shells, frame streams and the worker pool"""
+        atexit.unregister(self.close)
+        with self._shell_locks_guard:
+            send_queues, self._send_queues = self._send_queues, {}
+            send_threads, self._send_threads = self._send_threads, []
+        for send_queue in send_queues.values():
+            self._put_dropping_oldest(send_queue, None)
+        for thread in send_threads:
+            thread.join(timeout=1)
+        for device_id in list(self._frame_streams):
+            self.stop_frame_stream(device_id)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pool_size = 0
+        for device_id in list(self._shells):
+            self._drop_shell(device_id)
+        if self._cache_hits or self._cache_misses:
+            logger.info("Cache: %d hit(s), %d miss(es)", self._cache_hits, self._cache_misses)
     
     def execute_all(self, command: str, parallel: bool = True) -> List[Dict]:
         """Execute command on all devices"""
         if not self.devices:
-            print("No devices connected!")
+            logger.warning("No devices connected!")
             return []
         
-        results = []
-        
         if parallel:
-            with ThreadPoolExecutor(max_workers=len(self.devices)) as executor:
-                futures = {
-                    executor.submit(self.execute_command, device_id, command): device_id
-                    for device_id in self.devices
-                }
-                for future in as_completed(futures):
-                    results.append(future.result())
-        else:
-            for device_id in self.devices:
-                results.append(self.execute_command(device_id, command))
+            return self._fanout(lambda device_id: self.execute_command(device_id, command), self.devices)
+        return [self.execute_command(device_id, command) for device_id in self.devices]
+    
+    def _fanout(self, fn: Callable[[Any], Any], arg_iter) -> List:
+        """Run fn over arg_iter on the worker pool; results come back in submission order"""
+        return list(self._pool.map(fn, arg_iter))
+    
+    def _run_all(self, fn: Callable[..., Dict], *args) -> List[Dict]:
+        """Run fn(device_id, *args) on all devices in parallel"""
+        if not self.devices:
+            logger.warning("No devices connected!")
+            return []
+        return self._fanout(lambda device_id: fn(device_id, *args), self.devices)
+    
+    def _submit_all(self, fn: Callable[..., Dict], *args) -> List[Future]:
+        """Submit fn(device_id, *args) for all devices and return without waiting"""
+        futures = []
+        for device_id in self.devices:
+            future = self._pool.submit(fn, device_id, *args)
+            future.add_done_callback(self._report_async_result)
+            self._async_futures.append(future)
+            futures.append(future)
+        return futures
+    
+    @staticmethod
+    def _report_async_result(future: Future):
+        """Log failures of fire-and-forget commands (nobody else looks at their result)"""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.warning("Async command failed: %s", e)
+            return
+        if not result.get('success', False):
+            logger.warning("Async command failed on %s: %s", result.get('device_id'), result.get('error', 'unknown error'))
+    
+    def wait_async(self, timeout: Optional[float] = None):
+        """Wait for recently submitted fire-and-forget commands to finish"""
+        wait(list(self._async_futures), timeout=timeout)
+    
+    def _probe_touch_device(self, device_id: str) -> Optional[_TouchDevice]:
+        """Find the multi-touch input node of a device (probed once, then cached)"""
+        if device_id in self._touch_devices:
+            return self._touch_devices[device_id]
+        
+        touch = None
+        # The current rotation comes back in the same roundtrip and seeds the rotation cache
+        # (`true` last, so a build without SurfaceOrientation doesn't fail the getevent part)
+        result = self.execute_command(
+            device_id,
+            f'getevent -pl; echo {_SEP}; {_ROTATION_COMMAND}; true'
+        )
+        if result['success']:
+            getevent_output, _, orientation_output = result['output'].partition(f'{_SEP}\n')
+            rotation = self._parse_rotation(orientation_output)
+            if rotation is not None:
+                with self._cache_lock:
+                    self._cache[f'rotation:{device_id}'] = (time.monotonic(), rotation)
+            node = None
+            axes = {}
+            has_btn_touch = False
+            for line in getevent_output.splitlines():
+                device_match = _GETEVENT_DEVICE_RE.match(line)
+                if device_match:
+                    if 'ABS_MT_POSITION_X' in axes and 'ABS_MT_POSITION_Y' in axes:
+                        break  # Previous device was the touchscreen
+                    node, axes, has_btn_touch = device_match.group(1), {}, False
+                    continue
+                axis_match = _GETEVENT_AXIS_RE.search(line)
+                if axis_match:
+                    axes[axis_match.group(1)] = (int(axis_match.group(2)), int(axis_match.group(3)))
+                elif 'BTN_TOUCH' in line:
+                    has_btn_touch = True
+            if node and 'ABS_MT_POSITION_X' in axes and 'ABS_MT_POSITION_Y' in axes:
+                (min_x, max_x), (min_y, max_y) = axes['ABS_MT_POSITION_X'], axes['ABS_MT_POSITION_Y']
+                touch = _TouchDevice(node, min_x, max_x, min_y, max_y, has_btn_touch)
         
-        return results
+        self._touch_devices[device_id] = touch
+        return touch
+    
+    @staticmethod
+    def _parse_rotation(output: str) -> Optional[int]:
+        """Display rotation from `dumpsys input` output, None if it isn't reported"""
+        match = _SURFACE_ORIENTATION_RE.search(output)
+        return int(match.group(1)) if match else None
+    
+    def get_rotation(self, device_id: str) -> Optional[int]:
+        """Current display rotation in quarter turns, None if unknown
+        
+        Only the first lookup waits for dumpsys; after that the last known value is returned
+        and refreshed on the worker pool once it is older than _ROTATION_TTL.
+        """
+        key = f'rotation:{device_id}'
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            refresh = (entry is not None and time.monotonic() - entry[0] >= _ROTATION_TTL
+                       and device_id not in self._rotation_refreshes)
+            if refresh:
+                self._rotation_refreshes.add(device_id)
+        if entry is None:
+            return self._refresh_rotation(device_id)
+        if refresh:
+            try:
+                self._pool.submit(self._refresh_rotation, device_id)
+            except (AttributeError, RuntimeError):
+                # Pool already shut down by close() - keep serving the last value
+                with self._cache_lock:
+                    self._rotation_refreshes.discard(device_id)
+        return entry[1]
+    
+    def _refresh_rotation(self, device_id: str) -> Optional[int]:
+        """Query the display rotation and cache it (a failed lookup keeps the previous value)"""
+        try:
+            rotation = self._parse_rotation(self.execute_command(device_id, _ROTATION_COMMAND).get('output', ''))
+            if rotation is not None:
+                with self._cache_lock:
+                    self._cache[f'rotation:{device_id}'] = (time.monotonic(), rotation)
+            return rotation
+        finally:
+            with self._cache_lock:
+                self._rotation_refreshes.discard(device_id)
+    
+    def get_touch_range(self, device_id: str) -> Optional[Tuple[str, int, int]]:
+        """Touchscreen input node of a device and its (max_x, max_y) axis range, None if not found"""
+        touch = self._probe_touch_device(device_id)
+        return (touch.node, touch.max_x, touch.max_y) if touch else None
+    
+    def touch_to_screen(self, device_id: str, raw_x: int, raw_y: int, screen: Dict) -> Optional[Tuple[int, int]]:
+        """Map a raw touch panel point of a device (e.g. from getevent) to `input` coordinates in its current rotation"""
+        touch = self._probe_touch_device(device_id)
+        if touch is None:
+            return None
+        rotation = self.get_rotation(device_id)
+        return touch.to_screen(raw_x, raw_y, screen, rotation or 0)
+    
+    def _send_touch(self, device_id: str, build_command: Callable[[_TouchDevice, Dict, int], str]) -> Optional[Dict]:
+        """Inject a touch gesture with sendevent; returns None if the caller should fall back to `input`"""
+        touch = self._probe_touch_device(device_id)
+        if touch is None:
+            return None
+        screen = self.get_screen_info(device_id)
+        if screen['width'] == 0 or screen['height'] == 0:
+            return None
+        # Without the rotation the panel point can't be worked out - `input` handles rotation itself
+        rotation = self.get_rotation(device_id)
+        if rotation is None:
+            return None
+        result = self.execute_command(device_id, build_command(touch, screen, rotation), decode=False)
+        if not result['success']:
+            # e.g. no write access to /dev/input on this build - stop trying sendevent here
+            self._touch_devices[device_id] = None
+            return None
+        return result
     
     def tap(self, device_id: str, x: int, y: int):
         """Tap on screen coordinates"""
-        return self.execute_command(device_id, f'input tap {x} {y}')
+        result = self._send_touch(
+            device_id,
+            lambda touch, screen, rotation: touch.tap_command(*touch.to_raw(x, y, screen, rotation))
+        )
+        if result is not None:
+            return result
+        return self.execute_command(device_id, f'input tap {x} {y}', decode=False)
     
     def tap_all(self, x: int, y: int):
         """Tap on all devices"""
-        return self.execute_all(f'input tap {x} {y}')
+        return self._run_all(self.tap, x, y)
+    
+    def tap_all_async(self, x: int, y: int) -> List[Future]:
+        """Tap on all devices without waiting for them to finish"""
+        return self._submit_all(self.tap, x, y)
     
     def swipe(self, device_id: str, x1: int, y1: int, x2: int, y2: int, duration: int = 300):
         """Swipe on screen"""
+        result = self._send_touch(
+            device_id,
+            lambda touch, screen, rotation: touch.swipe_command(
+                *touch.to_raw(x1, y1, screen, rotation), *touch.to_raw(x2, y2, screen, rotation), duration
+            )
+        )
+        if result is not None:
+            return result
         return self.execute_command(
             device_id,
-            f'input swipe {x1} {y1} {x2} {y2} {duration}'
+            f'input swipe {x1} {y1} {x2} {y2} {duration}',
+            decode=False
         )
     
     def swipe_all(self, x1: int, y1: int, x2: int, y2: int, duration: int = 300):
         """Swipe on all devices"""
-        return self.execute_all(f'input swipe {x1} {y1} {x2} {y2} {duration}')
+        return self._run_all(self.swipe, x1, y1, x2, y2, duration)
+    
+    def swipe_all_async(self, x1: int, y1: int, x2: int, y2: int, duration: int = 300) -> List[Future]:
+        """Swipe on all devices without waiting for them to finish"""
+        return self._submit_all(self.swipe, x1, y1, x2, y2, duration)
     
     def input_text(self, device_id: str, text: str):
         """Input text (requires keyboard to be open)"""
-        # Escape special characters
-        text = text.replace(' ', '%s').replace('&', '\\&')
-        return self.execute_command(device_id, f'input text "{text}"')
+        return self.execute_command(device_id, f'input text {shlex.quote(text.translate(_INPUT_TEXT_TABLE))}')
     
     def input_text_all(self, text: str):
         """Input text on all devices"""
-        text = text.replace(' ', '%s').replace('&', '\\&')
-        return self.execute_all(f'input text "{text}"')
+        return self.execute_all(f'input text {shlex.quote(text.translate(_INPUT_TEXT_TABLE))}')
     
     def press_key(self, device_id: str, keycode: str):
         """Press a key (HOME, BACK, MENU, etc.)"""
-        return self.execute_command(device_id, f'input keyevent {keycode}')
+        return self.execute_command(device_id, f'input keyevent {keycode}', decode=False)
     
     def press_key_all(self, keycode: str):
         """Press key on all devices"""
-        return self.execute_all(f'input keyevent {keycode}')
+        return self._run_all(self.press_key, keycode)
     
     def get_screen_info(self, device_id: str) -> Dict:
-        """Get screen dimensions - uses override size if available (for coordinate mapping)"""
-        import re
+        """Get screen dimensions - uses override size if available (for coordinate mapping, cached for 30s)"""
+        key = f'screen:{device_id}'
+        info = self._cached(key, 30.0, lambda: self._fetch_screen_info(device_id))
+        if info['width'] == 0:
+            self.invalidate(key)  # Don't keep a failed lookup around
+        return info
+    
+    def _fetch_screen_info(self, device_id: str) -> Dict:
+        # One roundtrip: wm size, plus the dumpsys fallback only when wm size printed no size
+        result = self.execute_command(
+            device_id,
+            f'size=$(wm size); echo "$size"; echo {_SEP}; '
+            'case "$size" in *[0-9]*x*[0-9]*) ;; '
+            '*) dumpsys window displays | grep -E "mDisplayWidth|mDisplayHeight" ;; esac'
+        )
+        wm_output, _, dumpsys_output = result.get('output', '').partition(f'{_SEP}\n')
+        output = wm_output.strip()
         
-        # Get wm size output
-        result = self.execute_command(device_id, 'wm size')
-        if result['success']:
-            output = result['output'].strip()
-            
-            # IMPORTANT: Use "Override size" if available, because that's what Android uses for input coordinates!
-            # If Android has display scaling enabled, input coordinates must match the override size, not physical size
-            override_match = re.search(r'Override size:\s*(\d+)\s*x\s*(\d+)', output, re.IGNORECASE)
-            if override_match:
-                width = int(override_match.group(1))
-                height = int(override_match.group(2))
-                return {'width': width, 'height': height, 'is_override': True}
-            
-            # If no override, use physical size
-            physical_match = re.search(r'Physical size:\s*(\d+)\s*x\s*(\d+)', output, re.IGNORECASE)
-            if physical_match:
-                width = int(physical_match.group(1))
-                height = int(physical_match.group(2))
-                return {'width': width, 'height': height, 'is_override': False}
-            
-            # Fallback: use any size found
-            match = re.search(r'(\d+)\s*x\s*(\d+)', output, re.IGNORECASE)
-            if match:
-                width = int(match.group(1))
-                height = int(match.group(2))
-                return {'width': width, 'height': height, 'is_override': False}
+        # IMPORTANT: Use "Override size" if available, because that's what Android uses for input coordinates!
+        # If Android has display scaling enabled, input coordinates must match the override size, not physical size
+        override_match = _RE_OVERRIDE.search(output)
+        if override_match:
+            width = int(override_match.group(1))
+            height = int(override_match.group(2))
+            return {'width': width, 'height': height, 'is_override': True}
         
-        # Alternative: Try using dumpsys window displays
-        result = self.execute_command(device_id, 'dumpsys window displays')
-        if result['success']:
-            output = result['output']
-            # Look for mDisplayWidth and mDisplayHeight
-            width_match = re.search(r'mDisplayWidth=(\d+)', output)
-            height_match = re.search(r'mDisplayHeight=(\d+)', output)
-            if width_match and height_match:
-                width = int(width_match.group(1))
-                height = int(height_match.group(2))
-                return {'width': width, 'height': height}
+        # If no override, use physical size
+        physical_match = _RE_PHYSICAL.search(output)
+        if physical_match:
+            width = int(physical_match.group(1))
+            height = int(physical_match.group(2))
+            return {'width': width, 'height': height, 'is_override': False}
+        
+        # Fallback: use any size found
+        match = _RE_ANYSIZE.search(output)
+        if match:
+            width = int(match.group(1))
+            height = int(match.group(2))
+            return {'width': width, 'height': height, 'is_override': False}
+        
+        # Alternative: dumpsys window displays (already fetched above)
+        # Look for mDisplayWidth and mDisplayHeight
+        width_match = _RE_DW.search(dumpsys_output)
+        height_match = _RE_DH.search(dumpsys_output)
+        if width_match and height_match:
+            width = int(width_match.group(1))
+            height = int(height_match.group(1))
+            return {'width': width, 'height': height}
         
         return {'width': 0, 'height': 0}
     
     def install_app(self, device_id: str, apk_path: str) -> Dict:
         """Install APK on device"""
         try:
-            result = subprocess.run(
-                ['adb', '-s', device_id, 'install', apk_path],
+            result = self._run_adb(
+                ['-s', device_id, 'install', apk_path],
                 capture_output=True,
                 text=True,
                 timeout=120
@@ -186,15 +949,11 @@ class PhoneController:
     
     def install_app_all(self, apk_path: str) -> List[Dict]:
         """Install APK on all devices"""
-        results = []
-        with ThreadPoolExecutor(max_workers=len(self.devices)) as executor:
-            futures = {
-                executor.submit(self.install_app, device_id, apk_path): device_id
-                for device_id in self.devices
-            }
-            for future in as_completed(futures):
-                results.append(future.result())
-        return results
+        if not self.devices:
+            logger.warning("No devices connected!")
+            return []
+        
+        return self._fanout(lambda device_id: self.install_app(device_id, apk_path), self.devices)
     
     def launch_app(self, device_id: str, package_name: str, activity_name: str):
         """Launch an app"""
@@ -207,25 +966,88 @@ class PhoneController:
         """Launch app on all devices"""
         return self.execute_all(f'am start -n {package_name}/{activity_name}')
     
+    def start_frame_stream(self, device_id: str):
+        """Keep a screencap loop running on the device for fast repeated screenshots (e.g. live mirroring)"""
+        stream = self._frame_streams.get(device_id)
+        if stream is None or not stream.is_alive():
+            self._frame_streams[device_id] = _FrameStream(device_id)
+    
+    def stop_frame_stream(self, device_id: str):
+        """Stop the device's screencap loop"""
+        stream = self._frame_streams.pop(device_id, None)
+        if stream:
+            stream.close()
+    
+    def read_frame(self, device_id: str) -> Optional[bytes]:
+        """Get the current screen as PNG bytes - uses the frame stream if started, else a one-off exec-out"""
+        stream = self._frame_streams.get(device_id)
+        if stream is not None:
+            try:
+                return stream.read_frame()
+            except (OSError, EOFError, ValueError) as e:
+                logger.warning("Frame stream for %s failed (%s), falling back to exec-out", device_id, e)
+                self.stop_frame_stream(device_id)
+        try:
+            result = self._run_adb(
+                ['-s', device_id, 'exec-out', 'screencap', '-p'],
+                capture_output=True,
+                check=True,
+                timeout=15
+            )
+            return result.stdout
+        except Exception as e:
+            logger.warning("Screenshot failed on %s: %s", device_id, e)
+            return None
+    
     def take_screenshot(self, device_id: str, save_path: str = None):
         """Take screenshot"""
         if save_path is None:
             save_path = f'screenshot_{device_id}.png'
+        if device_id in self._frame_streams:
+            frame = self.read_frame(device_id)
+            if frame is None:
+                return {'device_id': device_id, 'success': False, 'error': 'Screenshot failed'}
+            with open(save_path, 'wb') as f:
+                f.write(frame)
+            return {'device_id': device_id, 'success': True, 'path': save_path}
         try:
-            subprocess.run(
-                ['adb', '-s', device_id, 'shell', 'screencap', '-p', '/sdcard/screenshot.png'],
-                check=True
-            )
-            subprocess.run(
-                ['adb', '-s', device_id, 'pull', '/sdcard/screenshot.png', save_path],
-                check=True
-            )
+            # Stream the PNG straight to the file - no temp file on the device and no separate pull
+            with open(save_path, 'wb') as f:
+                self._run_adb(
+                    ['-s', device_id, 'exec-out', 'screencap', '-p'],
+                    stdout=f,
+                    check=True,
+                    timeout=15
+                )
             return {'device_id': device_id, 'success': True, 'path': save_path}
         except Exception as e:
             return {'device_id': device_id, 'success': False, 'error': str(e)}
     
+    def get_device_meta(self, device_id: str) -> Dict[str, str]:
+        """Get the fields `adb devices -l` reported for a device (model, product, device, ...) - no shell call"""
+        return dict(self._device_meta.get(device_id, {}))
+    
     def get_device_info(self, device_id: str) -> Dict:
-        """Get device information"""
+        """Get device information (prefetched by scan_devices with prefetch_info=True)"""
+        future = self._info_cache.get(device_id)
+        if future is not None:
+            info = future.result()
+            if info:
+                return info
+            self._info_cache.pop(device_id, None)  # Prefetch failed, retry directly
+        info = self._fetch_device_info(device_id)
+        if not info.get('model') and 'model' in self._device_meta.get(device_id, {}):
+            # Shell unreachable - the adb server still knows the model (with '_' for spaces)
+            info['model'] = self._device_meta[device_id]['model'].replace('_', ' ')
+        return info
+    
+    def get_device_info_all(self) -> Dict[str, Dict]:
+        """Get device information for all devices"""
+        if not self.devices:
+            return {}
+        return dict(zip(self.devices, self._fanout(self.get_device_info, self.devices)))
+    
+    def _fetch_device_info(self, device_id: str) -> Dict:
         info = {}
         commands = {
             'model': 'getprop ro.product.model',
@@ -233,10 +1055,12 @@ class PhoneController:
             'android_version': 'getprop ro.build.version.release',
             'serial': 'getprop ro.serialno'
         }
-        for key, cmd in commands.items():
-            result = self.execute_command(device_id, cmd)
-            if result['success']:
-                info[key] = result['output'].strip()
+        # Fetch all props in a single shell roundtrip, separated by a marker line
+        result = self.execute_command(device_id, f'; echo {_SEP}; '.join(commands.values()))
+        if result['success']:
+            values = result['output'].split(f'{_SEP}\n')
+            for key, value in zip(commands, values):
+                info[key] = value.strip()
         return info
 
 
@@ -2,62 +2,378 @@ import subprocess
 import threading
 import time
 import re
-from typing import List, Dict, Optional
+import shlex
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from phone_controller import PhoneController
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 try:
+    import ctypes
+    from ctypes import wintypes
     import win32gui
     import win32con
     WIN32_AVAILABLE = True
 except ImportError:
     WIN32_AVAILABLE = False
 
+# wm size / dumpsys output parsing
+_OVERRIDE_RE = re.compile(r'Override size:\s*(\d+)\s*x\s*(\d+)', re.IGNORECASE)
+_PHYSICAL_RE = re.compile(r'Physical size:\s*(\d+)\s*x\s*(\d+)', re.IGNORECASE)
+_ANY_SIZE_RE = re.compile(r'(\d+)\s*x\s*(\d+)', re.IGNORECASE)
+_MDISP_W_RE = re.compile(r'mDisplayWidth=(\d+)')
+_MDISP_H_RE = re.compile(r'mDisplayHeight=(\d+)')
+_WM_SIZE_RE = re.compile(r'(\d+)x(\d+)')
+# Keeps one-shot adb commands from flashing a console window on Windows (0 elsewhere)
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# `input text` reads %s as a space
+_INPUT_TEXT_TABLE = str.maketrans({' ': '%s'})
+
+# WinEvent hook constants (winuser.h)
+_EVENT_OBJECT_CREATE = 0x8000
+_EVENT_OBJECT_DESTROY = 0x8001
+_EVENT_OBJECT_SHOW = 0x8002
+_EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+_EVENT_OBJECT_NAMECHANGE = 0x800C
+_WINEVENT_OUTOFCONTEXT = 0x0000
+_OBJID_WINDOW = 0
+_WM_QUIT = 0x0012
+if WIN32_AVAILABLE:
+    _WINEVENTPROC = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                       wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+# getevent -lt lines: "[   12.345678] EV_ABS       ABS_MT_POSITION_X    000001f4"
+_GETEVENT_LINE_RE = re.compile(r'^\[\s*([\d.]+)\]\s+\w+\s+(ABS_MT_SLOT|ABS_MT_POSITION_X|ABS_MT_POSITION_Y|ABS_MT_TRACKING_ID|SYN_REPORT)\s+(\S+)')
+
+
+def _find_scrcpy_window(window_title: str, process_id: Optional[int] = None) -> Optional[int]:
+    """Find scrcpy window handle (with process_id: only a window of that process or titled exactly window_title)"""
+    title_lower = window_title.lower()
+    
+    def enum_handler(hwnd, ctx):
+        if win32gui.IsWindowVisible(hwnd):
+            title = win32gui.GetWindowText(hwnd)
+            if process_id is not None:
+                if title == window_title or _window_process_id(hwnd) == process_id:
+                    ctx.append(hwnd)
+            elif title_lower in title.lower() or 'scrcpy' in title.lower():
+                ctx.append(hwnd)
+        return True
+    
+    windows = []
+    win32gui.EnumWindows(enum_handler, windows)
+    return windows[0] if windows else None
+
+
+class _WinEventHook:
+    """Out-of-context SetWinEventHook running its own message loop thread (pywin32 doesn't wrap SetWinEventHook)"""
+    
+    def __init__(self, event_min: int, event_max: int, callback, process_id: int = 0):
+        """callback(event, hwnd) is called on the hook thread for window-level events"""
+        self._callback = callback
+        self._thread_id = None
+        self._ready = threading.Event()
+        self.active = False
+        threading.Thread(target=self._run, args=(event_min, event_max, process_id), daemon=True).start()
+        self._ready.wait(timeout=2)
+    
+    def _run(self, event_min: int, event_max: int, process_id: int):
+        try:
+            user32 = ctypes.windll.user32
+            
+            def handler(hook, event, hwnd, id_object, id_child, event_thread, event_time):
+                if id_object == _OBJID_WINDOW and hwnd:
+                    self._callback(event, hwnd)
+            
+            # Keep a reference to the thunk - ctypes frees it otherwise and the hook crashes
+            self._proc = _WINEVENTPROC(handler)
+            user32.SetWinEventHook.restype = wintypes.HANDLE
+            hook = user32.SetWinEventHook(event_min, event_max, None, self._proc,
+                                          process_id, 0, _WINEVENT_OUTOFCONTEXT)
+            self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        except (AttributeError, OSError):
+            hook = None
+        self.active = bool(hook)
+        self._ready.set()
+        if not hook:
+            return
+        
+        # Out-of-context hooks are delivered through this thread's message queue
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+        user32.UnhookWinEvent(hook)
+    
+    def stop(self):
+        """Unhook and end the message loop"""
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, _WM_QUIT, 0, 0)
+            self._thread_id = None
+
+
+def _wait_for_scrcpy_window(window_title: str, timeout: float = 10.0) -> Optional[int]:
+    """Wait for the scrcpy window to appear (WinEvent hooks, polling if the hooks can't be set)"""
+    title_lower = window_title.lower()
+    found = []
+    created = threading.Event()
+    
+    def on_event(event, hwnd):
+        if event == _EVENT_OBJECT_DESTROY:
+            return
+        # SDL creates its window untitled and hidden, so also re-check when it is shown or renamed
+        if not win32gui.IsWindowVisible(hwnd):
+            return
+        title = win32gui.GetWindowText(hwnd).lower()
+        if title and (title_lower in title or 'scrcpy' in title):
+            found.append(hwnd)
+            created.set()
+    
+    # Hook first, then check for a window that already exists, so neither misses it
+    hooks = [_WinEventHook(_EVENT_OBJECT_CREATE, _EVENT_OBJECT_SHOW, on_event),
+             _WinEventHook(_EVENT_OBJECT_NAMECHANGE, _EVENT_OBJECT_NAMECHANGE, on_event)]
+    try:
+        hwnd = _find_scrcpy_window(window_title)
+        if hwnd:
+            return hwnd
+        if all(hook.active for hook in hooks):
+            created.wait(timeout=timeout)
+            return found[0] if found else _find_scrcpy_window(window_title)
+        
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            hwnd = _find_scrcpy_window(window_title)
+            if hwnd:
+                return hwnd
+        return None
+    finally:
+        for hook in hooks:
+            hook.stop()
+
+
+def _window_process_id(hwnd: int) -> int:
+    """Id of the process owning a window"""
+    pid = wintypes.DWORD()
+    ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return pid.value
+
+
+class _MirrorGeometry:
+    """scrcpy window -> phone coordinate mapping, precomputed once per window move/resize"""
+    
+    def __init__(self, win_rect, client_screen_left: int, client_screen_top: int,
+                 client_width: int, client_height: int, phone_w: int, phone_h: int):
+        self.win_rect = win_rect
+        self.client_screen_left = client_screen_left
+        self.client_screen_top = client_screen_top
+        self.client_width = client_width
+        self.client_height = client_height
+        self.phone_w = phone_w
+        self.phone_h = phone_h
+        self.valid = client_width > 0 and client_height > 0 and phone_w > 0 and phone_h > 0
+        if not self.valid:
+            return
+        
+        # Calculate aspect ratios and scale factors
+        window_aspect = client_width / client_height
+        phone_aspect = phone_w / phone_h
+        self.scale_x = phone_w / client_width
+        self.scale_y = phone_h / client_height
+        
+        # Letterbox offsets and per-axis scale (no letterboxing: direct scaling)
+        letterbox_x = letterbox_y = 0
+        visible_width = client_width
+        visible_height = client_height
+        kx = self.scale_x
+        ky = self.scale_y
+        
+        # scrcpy maintains aspect ratio, so if aspect ratios don't match,
+        # there will be letterboxing (black bars). We need to account for this.
+        if abs(window_aspect - phone_aspect) > 0.01:  # Aspect ratio mismatch
+            # Use uniform scaling (scrcpy will letterbox to maintain aspect ratio)
+            kx = ky = min(self.scale_x, self.scale_y)
+            if window_aspect > phone_aspect:
+                # Window is wider - letterboxing on sides (vertical bars), content centered horizontally
+                visible_width = int(client_height * phone_aspect)
+                letterbox_x = (client_width - visible_width) // 2
+            else:
+                # Window is taller - letterboxing on top/bottom (horizontal bars), content centered vertically
+                visible_height = int(client_width / phone_aspect)
+                letterbox_y = (client_height - visible_height) // 2
+        
+        # Whole mapping as phone = a*rel + b per axis, plus the visible (non-letterbox) rect
+        self.a = kx
+        self.b = -letterbox_x * kx
+        self.c = ky
+        self.d = -letterbox_y * ky
+        self.valid_rect = (letterbox_x, letterbox_y, letterbox_x + visible_width, letterbox_y + visible_height)
+    
+    def to_phone(self, rel_x: int, rel_y: int):
+        """Map client-relative coordinates to phone coordinates, (None, None) inside the letterbox"""
+        left, top, right, bottom = self.valid_rect
+        if not (left <= rel_x <= right and top <= rel_y <= bottom):
+            return None, None
+        phone_x = int(self.a * rel_x + self.b)
+        phone_y = int(self.c * rel_y + self.d)
+        # Clamp to phone screen bounds (safety check)
+        return max(0, min(phone_x, self.phone_w - 1)), max(0, min(phone_y, self.phone_h - 1))
+
+
 class ScreenMirrorController:
-    def __init__(self, master_device: str, slave_devices: List[str]):
+    def __init__(self, master_device: str, slave_devices: List[str], persistent_shells: bool = True):
         self.master_device = master_device
         self.slave_devices = slave_devices
-        self.controller = PhoneController()
+        # False: send input with one isolated `adb shell` process per command (fanned out on the pool)
+        self.persistent_shells = persistent_shells
+        # Master is just another adb target for fan-out purposes
+        self._all_devices = [master_device] + slave_devices
+        # Created on first use - PhoneController() scans devices over adb
+        self._controller = None
+        self._controller_lock = threading.Lock()
+        # Set by close(); no PhoneController is created after that
+        self._closed = False
         self.mirroring_active = False
         self.scrcpy_process = None
+        # Last lines of scrcpy's stderr, drained by a reader thread
+        self._scrcpy_stderr = deque(maxlen=20)
+        self._scrcpy_stderr_thread = None
         self.master_screen_size = None
+        # 1/width and 1/height of the master, so per-event ratios are a multiply
+        self._master_w_inv = 0.0
+        self._master_h_inv = 0.0
         self.slave_screen_sizes = {}
-        self._cache_screen_sizes()
+        # (serial, width, height) per slave, width/height 0 if unknown - walked on every event
+        self._slaves: List[Tuple[str, int, int]] = [(slave, 0, 0) for slave in slave_devices]
+        # Runs screen-size detection, and the per-command fan-out without persistent shells
+        self._pool = ThreadPoolExecutor(max_workers=len(slave_devices) + 1, thread_name_prefix='mirror')
+        # Detect screen sizes in the background; taps before it finishes look sizes up on demand
+        threading.Thread(target=self._cache_screen_sizes, daemon=True).start()
+    
+    @property
+    def controller(self) -> PhoneController:
+        """PhoneController used for all adb traffic (created on first use)"""
+        if self._controller is None:
+            with self._controller_lock:
+                if self._closed:
+                    raise RuntimeError("ScreenMirrorController is closed")
+                if self._controller is None:
+                    self._controller = PhoneController()
+        return self._controller
     
     def _cache_screen_sizes(self):
-        """Cache screen sizes for all devices"""
-        print("[INFO] Detecting screen sizes for all devices...")
+        """Cache screen sizes for all devices (queried in parallel)"""
+        logger.info("Detecting screen sizes for all devices...")
         
-        # Get master screen size
-        self.master_screen_size = self.get_master_screen_size()
+        try:
+            master_future = self._pool.submit(self.get_master_screen_size)
+            slave_sizes = list(self._pool.map(self.controller.get_screen_info, self.slave_devices))
+            master_size = master_future.result()
+            # Warm the rotation cache too, so the first mirrored tap doesn't wait on dumpsys
+            list(self._pool.map(self.controller.get_rotation, self._all_devices))
+        except RuntimeError:
+            if self._closed:
+                return  # Closed before detection finished (pool shut down / no controller)
+            raise
+        if self._closed:
+            return
+        
+        # Master screen size
+        self._set_master_size(master_size)
         if self.master_screen_size['width'] > 0:
             override_note = " (override)" if self.master_screen_size.get('is_override', False) else " (physical)"
-            print(f"[INFO] Master ({self.master_device}): {self.master_screen_size['width']}x{self.master_screen_size['height']}{override_note}")
+            logger.info("Master (%s): %sx%s%s", self.master_device, self.master_screen_size['width'], self.master_screen_size['height'], override_note)
         else:
-            print(f"[WARNING] Could not detect master screen size")
+            logger.warning("Could not detect master screen size")
         
-        # Get slave screen sizes
-        for slave in self.slave_devices:
-            size = self.controller.get_screen_info(slave)
+        # Slave screen sizes
+        for slave, size in zip(self.slave_devices, slave_sizes):
             if size['width'] > 0:
                 self.slave_screen_sizes[slave] = size
                 override_note = " (override)" if size.get('is_override', False) else " (physical)"
-                print(f"[INFO] Slave ({slave}): {size['width']}x{size['height']}{override_note}")
+                logger.info("Slave (%s): %sx%s%s", slave, size['width'], size['height'], override_note)
             else:
-                print(f"[WARNING] Could not detect screen size for {slave}")
-        
+                logger.warning("Could not detect screen size for %s", slave)
+        self._rebuild_slave_list()
+    
+    def _rebuild_slave_list(self):
+        """Flatten cached slave sizes into the (serial, width, height) list"""
+        slaves = []
+        for slave in self.slave_devices:
+            size = self.slave_screen_sizes.get(slave)
+            slaves.append((slave, size['width'], size['height']) if size else (slave, 0, 0))
+        self._slaves = slaves
+    
+    def _oriented(self, device: str, width: int, height: int) -> Tuple[int, int]:
+        """(width, height) of a device in its current rotation - `wm size` always reports the natural one"""
+        if self.controller.get_rotation(device) in (1, 3):
+            return height, width
+        return width, height
+    
+    def _master_inverses(self) -> Tuple[float, float]:
+        """1/width and 1/height of the master in its current rotation, matching its `input` coordinates"""
+        if self.controller.get_rotation(self.master_device) in (1, 3):
+            return self._master_h_inv, self._master_w_inv
+        return self._master_w_inv, self._master_h_inv
+    
+    def _set_master_size(self, size: Dict):
+        """Remember the master screen size and its reciprocals"""
+        self.master_screen_size = size
+        if size['width'] > 0 and size['height'] > 0:
+            self._master_w_inv = 1.0 / size['width']
+            self._master_h_inv = 1.0 / size['height']
+    
+    def _wait_scrcpy_ready(self, proc: subprocess.Popen, window_title: str, timeout: float = 4.0) -> Optional[int]:
+        """Wait until scrcpy exits (returns its exit code) or its window shows up / timeout passes (returns None)"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            rc = proc.poll()
+            if rc is not None:
+                return rc
+            # Only our scrcpy's window counts - not e.g. an Explorer window on a "scrcpy" folder
+            if WIN32_AVAILABLE and _find_scrcpy_window(window_title, proc.pid):
+                return None
+            time.sleep(0.05)
+        return proc.poll()
+    
+    def _launch_scrcpy(self, cmd: List[str]) -> subprocess.Popen:
+        """Start scrcpy with a reader thread keeping the tail of its stderr"""
+        # stdout is never read - a PIPE would eventually fill up and stall scrcpy's logging
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace'
+        )
+        tail = self._scrcpy_stderr = deque(maxlen=20)
+        self._scrcpy_stderr_thread = threading.Thread(target=tail.extend, args=(proc.stderr,), daemon=True)
+        self._scrcpy_stderr_thread.start()
+        return proc
+    
+    def _scrcpy_error_output(self) -> str:
+        """stderr tail of an exited scrcpy"""
+        if self._scrcpy_stderr_thread:
+            self._scrcpy_stderr_thread.join(timeout=1)
+        return ''.join(self._scrcpy_stderr)
+    
     def start_screen_mirror(self, window_title: str = "Phone Master"):
         """Start scrcpy to mirror master device screen on PC"""
         try:
             # Check if scrcpy is installed
             subprocess.run(['scrcpy', '--version'], 
-                         capture_output=True, 
+                         stdout=subprocess.DEVNULL, 
+                         stderr=subprocess.DEVNULL, 
                          check=True)
         except (subprocess.CalledProcessError, FileNotFoundError):
-            print("ERROR: scrcpy not found!")
-            print("Please install scrcpy:")
-            print("  Windows: Download from https://github.com/Genymobile/scrcpy/releases")
-            print("  Or use: winget install scrcpy")
+            logger.error("scrcpy not found!")
+            logger.info("Please install scrcpy:")
+            logger.info("  Windows: Download from https://github.com/Genymobile/scrcpy/releases")
+            logger.info("  Or use: winget install scrcpy")
             return False
         
         try:
@@ -74,19 +390,14 @@ class ScreenMirrorController:
                 '--disable-screensaver',  # Prevent screen saver interference
             ]
             
-            self.scrcpy_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
+            self.scrcpy_process = self._launch_scrcpy(cmd)
             
-            # Wait a moment and check if scrcpy started successfully
-            time.sleep(2)
-            if self.scrcpy_process.poll() is not None:
+            # Wait until scrcpy is up (or has failed) and check if it started successfully
+            if self._wait_scrcpy_ready(self.scrcpy_process, window_title) is not None:
                 # Process already terminated - there was an error
-                stderr_output = self.scrcpy_process.stderr.read().decode('utf-8', errors='ignore') if self.scrcpy_process.stderr else ""
-                print(f"[WARNING] scrcpy with --no-control failed, trying without it...")
-                print(f"[INFO] Error: {stderr_output[:200] if stderr_output else 'Unknown error'}")
+                stderr_output = self._scrcpy_error_output()
+                logger.warning("scrcpy with --no-control failed, trying without it...")
+                logger.info("Error: %s", stderr_output[:200] if stderr_output else 'Unknown error')
                 
                 # Fallback: try without --no-control (can use --turn-screen-off here)
                 cmd_fallback = [
@@ -98,29 +409,24 @@ class ScreenMirrorController:
                     '--disable-screensaver',
                 ]
                 
-                self.scrcpy_process = subprocess.Popen(
-                    cmd_fallback,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE
-                )
+                self.scrcpy_process = self._launch_scrcpy(cmd_fallback)
                 
-                time.sleep(2)
-                if self.scrcpy_process.poll() is not None:
-                    stderr_output = self.scrcpy_process.stderr.read().decode('utf-8', errors='ignore') if self.scrcpy_process.stderr else ""
-                    print(f"[ERROR] scrcpy failed to start!")
+                if self._wait_scrcpy_ready(self.scrcpy_process, window_title) is not None:
+                    stderr_output = self._scrcpy_error_output()
+                    logger.error("scrcpy failed to start!")
                     if stderr_output:
-                        print(f"[ERROR] scrcpy error: {stderr_output[:300]}")
-                    print(f"[INFO] Make sure the device is connected: adb devices")
+                        logger.error("scrcpy error: %s", stderr_output[:300])
+                    logger.info("Make sure the device is connected: adb devices")
                     return False
                 else:
-                    print(f"[WARNING] scrcpy started without --no-control flag")
-                    print(f"[WARNING] Master device may have word selection issues - consider updating scrcpy")
+                    logger.warning("scrcpy started without --no-control flag")
+                    logger.warning("Master device may have word selection issues - consider updating scrcpy")
             
-            print(f"[OK] Screen mirroring started for master device: {self.master_device}")
-            print(f"  Window title: {window_title}")
+            logger.info("[OK] Screen mirroring started for master device: %s", self.master_device)
+            logger.info("  Window title: %s", window_title)
             return True
         except Exception as e:
-            print(f"[ERROR] Error starting screen mirror: {e}")
+            logger.error("Error starting screen mirror: %s", e)
             return False
     
     def stop_screen_mirror(self):
@@ -129,243 +435,233 @@ class ScreenMirrorController:
             self.scrcpy_process.terminate()
             self.scrcpy_process.wait()
             self.scrcpy_process = None
-            print("Screen mirroring stopped")
+            logger.info("Screen mirroring stopped")
+    
+    def close(self):
+        """Stop mirroring and close the worker pool and persistent adb shells"""
+        self.stop_screen_mirror()
+        with self._controller_lock:
+            self._closed = True
+            controller = self._controller
+        self._pool.shutdown(wait=False)
+        if controller is not None:
+            controller.close()
+    
+    def _run_on_device(self, device: str, command: str) -> Dict:
+        """Send a shell command to one device - queued for its persistent adb shell's writer, not waited on"""
+        if not self.persistent_shells:
+            return self._run_adb_shell(device, command)
+        result = self.controller.queue_command(device, command)
+        if result['success']:
+            return {'device': device, 'success': True}
+        return {
+            'device': device,
+            'success': False,
+            'error': result['error']
+        }
+    
+    def _run_adb_shell(self, device: str, command: str) -> Dict:
+        """Run a shell command on one device with its own `adb shell` process"""
+        try:
+            result = subprocess.run(
+                ['adb', '-s', device, 'shell', command],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+                creationflags=_CREATE_NO_WINDOW
+            )
+            return {
+                'device': device,
+                'success': result.returncode == 0
+            }
+        except Exception as e:
+            return {
+                'device': device,
+                'success': False,
+                'error': str(e)
+            }
+    
+    def _fan_out(self, fn, tasks) -> List[Dict]:
+        """Apply fn to every task - inline for persistent-shell queueing, in parallel on the pool for adb processes"""
+        if self.persistent_shells:
+            return [fn(task) for task in tasks]
+        return list(self._pool.map(fn, tasks))
     
     def execute_on_slaves(self, command: str):
         """Execute command on all slave devices"""
-        results = []
-        for slave in self.slave_devices:
-            try:
-                result = subprocess.run(
-                    ['adb', '-s', slave, 'shell', command],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                results.append({
-                    'device': slave,
-                    'success': result.returncode == 0
-                })
-            except Exception as e:
-                results.append({
-                    'device': slave,
-                    'success': False,
-                    'error': str(e)
-                })
-        return results
-    
-    def mirror_tap(self, x: int, y: int):
+        return self._fan_out(lambda slave: self._run_on_device(slave, command), self.slave_devices)
+    
+    def execute_on_slaves_argv(self, argv: List[str]):
+        """Execute a pre-split command on all slave devices (each argument is shell-quoted)"""
+        return self.execute_on_slaves(shlex.join(argv))
+    
+    def _get_slave_size(self, slave: str) -> Dict:
+        """Get slave screen size (use cache if available)"""
+        if slave in self.slave_screen_sizes:
+            return self.slave_screen_sizes[slave]
+        slave_size = self.controller.get_screen_info(slave)
+        if slave_size['width'] > 0:
+            self.slave_screen_sizes[slave] = slave_size  # Cache it
+            self._rebuild_slave_list()
+        return slave_size
+    
+    def _tap_on_device(self, task) -> Dict:
+        """Tap one device, task is (device, x, y, screen width, height) - 0 if unscaled"""
+        device, x, y, sw, sh = task
+        result = self._run_on_device(device, f'input tap {x} {y}')
+        if sw:
+            result['coords'] = f"({x}, {y})"
+            result['screen'] = f"{sw}x{sh}"
+        return result
+    
+    def _swipe_on_device(self, task) -> Dict:
+        """Swipe one device, task is (device, x1, y1, x2, y2, duration)"""
+        device, x1, y1, x2, y2, duration = task
+        return self._run_on_device(device, f'input swipe {x1} {y1} {x2} {y2} {duration}')
+    
+    def mirror_batch(self, cmds: List[str], include_master: bool = True) -> List[Dict]:
+        """Run several shell commands as one call per device"""
+        command = '; '.join(cmds)
+        devices = self._all_devices if include_master else self.slave_devices
+        return self._fan_out(lambda device: self._run_on_device(device, command), devices)
+    
+    def mirror_tap(self, x: int, y: int, include_master: bool = True):
         """Mirror tap action to master and all slaves using proportional coordinates"""
-        # Get master screen size
-        master_size = self.get_master_screen_size()
+        # Master size is fixed for the session; only re-query if it was never detected
+        master_size = self.master_screen_size
+        if not master_size or master_size['width'] == 0:
+            master_size = self.get_master_screen_size()
+        # Master is tapped in the same round as the slaves (since scrcpy input is disabled)
+        tasks = [(self.master_device, x, y, 0, 0)] if include_master else []
         if master_size['width'] == 0 or master_size['height'] == 0:
-            print("[WARNING] Could not get master screen size, using absolute coordinates")
-            # Fallback to absolute coordinates - send to master first
-            try:
-                subprocess.run(
-                    ['adb', '-s', self.master_device, 'shell', f'input tap {x} {y}'],
-                    capture_output=True,
-                    timeout=5
-                )
-            except:
-                pass
-            # Then send to slaves
-            if self.slave_devices:
-                results = self.execute_on_slaves(f'input tap {x} {y}')
+            logger.warning("Could not get master screen size, using absolute coordinates")
+            # Fallback to absolute coordinates on every device
+            tasks.extend((slave, x, y, 0, 0) for slave in self.slave_devices)
         else:
-            # Calculate percentage/ratio of click position on master
-            ratio_x = x / master_size['width']
-            ratio_y = y / master_size['height']
-            
-            print(f"[MIRROR] Master tap at ({x}, {y}) on {master_size['width']}x{master_size['height']} = ({ratio_x*100:.1f}%, {ratio_y*100:.1f}%)")
+            # Calculate percentage/ratio of click position on master (x, y follow its current rotation)
+            w_inv, h_inv = self._master_inverses()
+            ratio_x = x * w_inv
+            ratio_y = y * h_inv
             
-            # Send tap to master device first (since scrcpy input is disabled)
-            try:
-                subprocess.run(
-                    ['adb', '-s', self.master_device, 'shell', f'input tap {x} {y}'],
-                    capture_output=True,
-                    timeout=5
-                )
-            except Exception as e:
-                print(f"[WARNING] Failed to send tap to master: {e}")
+            logger.info("[MIRROR] Master tap at (%d, %d) on %dx%d = (%.1f%%, %.1f%%)",
+                        x, y, *self._oriented(self.master_device, master_size['width'], master_size['height']),
+                        ratio_x * 100, ratio_y * 100)
             
-            # Send proportional coordinates to each slave
-            results = []
-            for slave in self.slave_devices:
-                # Get slave screen size (use cache if available)
-                if slave in self.slave_screen_sizes:
-                    slave_size = self.slave_screen_sizes[slave]
-                else:
-                    slave_size = self.controller.get_screen_info(slave)
-                    if slave_size['width'] > 0:
-                        self.slave_screen_sizes[slave] = slave_size  # Cache it
+            # Work out proportional coordinates for each slave
+            for slave, sw, sh in self._slaves:
+                if not sw or not sh:
+                    # Size wasn't detected up front - retry the lookup-by-serial path
+                    slave_size = self._get_slave_size(slave)
+                    sw, sh = slave_size['width'], slave_size['height']
                 
-                if slave_size['width'] > 0 and slave_size['height'] > 0:
+                if sw > 0 and sh > 0:
+                    sw, sh = self._oriented(slave, sw, sh)
                     # Calculate coordinates for this slave based on same percentage
-                    slave_x = int(slave_size['width'] * ratio_x)
-                    slave_y = int(slave_size['height'] * ratio_y)
+                    slave_x = int(sw * ratio_x)
+                    slave_y = int(sh * ratio_y)
                     
                     # Clamp to screen bounds (safety check)
-                    slave_x = max(0, min(slave_x, slave_size['width'] - 1))
-                    slave_y = max(0, min(slave_y, slave_size['height'] - 1))
-                    
-                    print(f"  -> {slave}: ({slave_x}, {slave_y}) on {slave_size['width']}x{slave_size['height']} screen ({ratio_x*100:.1f}%, {ratio_y*100:.1f}%)")
+                    slave_x = max(0, min(slave_x, sw - 1))
+                    slave_y = max(0, min(slave_y, sh - 1))
                     
-                    # Execute tap on this slave
-                    try:
-                        result = subprocess.run(
-                            ['adb', '-s', slave, 'shell', f'input tap {slave_x} {slave_y}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        results.append({
-                            'device': slave,
-                            'success': result.returncode == 0,
-                            'coords': f"({slave_x}, {slave_y})",
-                            'screen': f"{slave_size['width']}x{slave_size['height']}"
-                        })
-                    except Exception as e:
-                        results.append({
-                            'device': slave,
-                            'success': False,
-                            'error': str(e)
-                        })
+                    logger.info("  -> %s: (%d, %d) on %dx%d screen (%.1f%%, %.1f%%)",
+                                slave, slave_x, slave_y, sw, sh, ratio_x * 100, ratio_y * 100)
+                    tasks.append((slave, slave_x, slave_y, sw, sh))
                 else:
-                    print(f"[WARNING] Could not get screen size for {slave}, using absolute coordinates")
+                    logger.warning("Could not get screen size for %s, using absolute coordinates", slave)
                     # Fallback for this device
-                    try:
-                        result = subprocess.run(
-                            ['adb', '-s', slave, 'shell', f'input tap {x} {y}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        results.append({
-                            'device': slave,
-                            'success': result.returncode == 0
-                        })
-                    except Exception as e:
-                        results.append({
-                            'device': slave,
-                            'success': False,
-                            'error': str(e)
-                        })
+                    tasks.append((slave, x, y, 0, 0))
+        
+        results = self._fan_out(self._tap_on_device, tasks)
+        if include_master:
+            master_result = results.pop(0)
+            if not master_result['success']:
+                logger.warning("Failed to send tap to master: %s", master_result['error'])
         
         # Print results for debugging
         success_count = sum(1 for r in results if r.get('success', False))
         if success_count < len(results):
-            print(f"[WARNING] Only {success_count}/{len(results)} slaves received the command successfully")
+            logger.warning("Only %d/%d slaves received the command successfully", success_count, len(results))
             for result in results:
                 if not result.get('success', False):
-                    print(f"  - {result.get('device', 'unknown')}: {result.get('error', 'unknown error')}")
+                    logger.warning("  - %s: %s", result.get('device', 'unknown'), result.get('error', 'unknown error'))
         else:
-            print(f"[SUCCESS] Tap sent to all {len(self.slave_devices)} slave(s)")
+            logger.info("[SUCCESS] Tap sent to all %d slave(s)", len(self.slave_devices))
             # Show coordinates used for each slave
             for result in results:
                 if 'coords' in result:
-                    print(f"  - {result['device']}: {result['coords']} on {result['screen']} screen")
+                    logger.info("  - %s: %s on %s screen", result['device'], result['coords'], result['screen'])
     
-    def mirror_swipe(self, x1: int, y1: int, x2: int, y2: int, duration: int = 300):
+    def mirror_swipe(self, x1: int, y1: int, x2: int, y2: int, duration: int = 300, include_master: bool = True):
         """Mirror swipe action to master and all slaves using proportional coordinates"""
-        # Get master screen size
-        master_size = self.get_master_screen_size()
+        if x1 == x2 and y1 == y2 and duration < 400:
+            # Zero-length and shorter than Android's long-press timeout - that's a tap, which doesn't block for `duration`
+            return self.mirror_tap(x1, y1, include_master=include_master)
+        # Master size is fixed for the session; only re-query if it was never detected
+        master_size = self.master_screen_size
+        if not master_size or master_size['width'] == 0:
+            master_size = self.get_master_screen_size()
+        # Master swipes in the same round as the slaves (since scrcpy input is disabled)
+        tasks = [(self.master_device, x1, y1, x2, y2, duration)] if include_master else []
         if master_size['width'] == 0 or master_size['height'] == 0:
-            print("[WARNING] Could not get master screen size, using absolute coordinates")
-            # Fallback to absolute coordinates - send to master first
-            try:
-                subprocess.run(
-                    ['adb', '-s', self.master_device, 'shell', f'input swipe {x1} {y1} {x2} {y2} {duration}'],
-                    capture_output=True,
-                    timeout=5
-                )
-            except:
-                pass
-            # Then send to slaves
-            if self.slave_devices:
-                self.execute_on_slaves(f'input swipe {x1} {y1} {x2} {y2} {duration}')
+            logger.warning("Could not get master screen size, using absolute coordinates")
+            # Fallback to absolute coordinates on every device
+            tasks.extend((slave, x1, y1, x2, y2, duration) for slave in self.slave_devices)
         else:
-            # Calculate percentage/ratio of swipe positions on master
-            ratio_x1 = x1 / master_size['width']
-            ratio_y1 = y1 / master_size['height']
-            ratio_x2 = x2 / master_size['width']
-            ratio_y2 = y2 / master_size['height']
-            
-            print(f"[MIRROR] Master swipe from ({x1}, {y1}) to ({x2}, {y2})")
+            # Calculate percentage/ratio of swipe positions on master (in its current rotation)
+            w_inv, h_inv = self._master_inverses()
+            ratio_x1 = x1 * w_inv
+            ratio_y1 = y1 * h_inv
+            ratio_x2 = x2 * w_inv
+            ratio_y2 = y2 * h_inv
             
-            # Send swipe to master device first (since scrcpy input is disabled)
-            try:
-                subprocess.run(
-                    ['adb', '-s', self.master_device, 'shell', f'input swipe {x1} {y1} {x2} {y2} {duration}'],
-                    capture_output=True,
-                    timeout=5
-                )
-            except Exception as e:
-                print(f"[WARNING] Failed to send swipe to master: {e}")
+            logger.info("[MIRROR] Master swipe from (%d, %d) to (%d, %d)", x1, y1, x2, y2)
             
-            # Send proportional coordinates to each slave
-            for slave in self.slave_devices:
-                # Get slave screen size (use cache if available)
-                if slave in self.slave_screen_sizes:
-                    slave_size = self.slave_screen_sizes[slave]
-                else:
-                    slave_size = self.controller.get_screen_info(slave)
-                    if slave_size['width'] > 0:
-                        self.slave_screen_sizes[slave] = slave_size  # Cache it
+            # Work out proportional coordinates for each slave
+            for slave, sw, sh in self._slaves:
+                if not sw or not sh:
+                    # Size wasn't detected up front - retry the lookup-by-serial path
+                    slave_size = self._get_slave_size(slave)
+                    sw, sh = slave_size['width'], slave_size['height']
                 
-                if slave_size['width'] > 0 and slave_size['height'] > 0:
+                if sw > 0 and sh > 0:
+                    sw, sh = self._oriented(slave, sw, sh)
                     # Calculate coordinates for this slave based on same percentage
-                    slave_x1 = int(slave_size['width'] * ratio_x1)
-                    slave_y1 = int(slave_size['height'] * ratio_y1)
-                    slave_x2 = int(slave_size['width'] * ratio_x2)
-                    slave_y2 = int(slave_size['height'] * ratio_y2)
-                    
-                    # Execute swipe on this slave
-                    try:
-                        subprocess.run(
-                            ['adb', '-s', slave, 'shell', f'input swipe {slave_x1} {slave_y1} {slave_x2} {slave_y2} {duration}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                    except Exception as e:
-                        print(f"[ERROR] Failed to swipe on {slave}: {e}")
+                    slave_x1 = int(sw * ratio_x1)
+                    slave_y1 = int(sh * ratio_y1)
+                    slave_x2 = int(sw * ratio_x2)
+                    slave_y2 = int(sh * ratio_y2)
+                    tasks.append((slave, slave_x1, slave_y1, slave_x2, slave_y2, duration))
                 else:
                     # Fallback for this device
-                    try:
-                        subprocess.run(
-                            ['adb', '-s', slave, 'shell', f'input swipe {x1} {y1} {x2} {y2} {duration}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                    except Exception as e:
-                        print(f"[ERROR] Failed to swipe on {slave}: {e}")
+                    tasks.append((slave, x1, y1, x2, y2, duration))
+        
+        results = self._fan_out(self._swipe_on_device, tasks)
+        if include_master:
+            master_result = results.pop(0)
+            if not master_result['success']:
+                logger.warning("Failed to send swipe to master: %s", master_result['error'])
+        for result in results:
+            if not result['success']:
+                logger.error("Failed to swipe on %s: %s", result['device'], result['error'])
     
     def mirror_key(self, keycode: str):
         """Mirror key press to master and all slaves"""
-        # Send to master first (since scrcpy input is disabled)
-        try:
-            subprocess.run(
-                ['adb', '-s', self.master_device, 'shell', f'input keyevent {keycode}'],
-                capture_output=True,
-                timeout=5
-            )
-        except:
-            pass
-        # Then send to slaves
+        # Master goes too (since scrcpy input is disabled), in the same round as the slaves
         if self.slave_devices:
-            print(f"Mirroring key {keycode} to {len(self.slave_devices)} slaves...")
-            self.execute_on_slaves(f'input keyevent {keycode}')
+            logger.info("Mirroring key %s to %d slaves...", keycode, len(self.slave_devices))
+        self.mirror_batch([f'input keyevent {keycode}'])
     
-    def mirror_text(self, text: str):
-        """Mirror text input to all slaves"""
+    def mirror_text(self, text: str, pre: Optional[List[str]] = None, post: Optional[List[str]] = None):
+        """Mirror text input to all slaves, with optional keycodes to press before/after it"""
         if not self.slave_devices:
             return
-        # Escape text for ADB
-        text = text.replace(' ', '%s').replace('&', '\\&')
-        print(f"Mirroring text to {len(self.slave_devices)} slaves...")
-        self.execute_on_slaves(f'input text "{text}"')
+        logger.info("Mirroring text to %d slaves...", len(self.slave_devices))
+        cmds = [f'input keyevent {key}' for key in pre or []]
+        # Quote as a single argv entry so quotes/backslashes/$ in the text reach `input` untouched
+        cmds.append(shlex.join(['input', 'text', text.translate(_INPUT_TEXT_TABLE)]))
+        cmds.extend(f'input keyevent {key}' for key in post or [])
+        self.mirror_batch(cmds, include_master=False)
     
     def get_master_screen_size(self) -> Dict:
         """Get master device screen dimensions (uses cache if available)"""
@@ -374,59 +670,53 @@ class ScreenMirrorController:
         
         try:
             # First try wm size
-            result = subprocess.run(
-                ['adb', '-s', self.master_device, 'shell', 'wm', 'size'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            output = result.stdout.strip()
+            result = self.controller.execute_command(self.master_device, 'wm size')
+            if not result['success']:
+                raise RuntimeError(result['error'])
+            output = result['output'].strip()
             
             # IMPORTANT: Use "Override size" if available, because that's what Android uses for input coordinates!
-            override_match = re.search(r'Override size:\s*(\d+)\s*x\s*(\d+)', output, re.IGNORECASE)
+            override_match = _OVERRIDE_RE.search(output)
             if override_match:
                 width = int(override_match.group(1))
                 height = int(override_match.group(2))
                 size = {'width': width, 'height': height, 'is_override': True}
-                self.master_screen_size = size
+                self._set_master_size(size)
                 return size
             
             # If no override, use physical size
-            physical_match = re.search(r'Physical size:\s*(\d+)\s*x\s*(\d+)', output, re.IGNORECASE)
+            physical_match = _PHYSICAL_RE.search(output)
             if physical_match:
                 width = int(physical_match.group(1))
                 height = int(physical_match.group(2))
                 size = {'width': width, 'height': height, 'is_override': False}
-                self.master_screen_size = size
+                self._set_master_size(size)
                 return size
             
             # Fallback: use any size found
-            match = re.search(r'(\d+)\s*x\s*(\d+)', output, re.IGNORECASE)
+            match = _ANY_SIZE_RE.search(output)
             if match:
                 width = int(match.group(1))
                 height = int(match.group(2))
                 size = {'width': width, 'height': height, 'is_override': False}
-                self.master_screen_size = size
+                self._set_master_size(size)
                 return size
             
             # Alternative: Try dumpsys
-            result = subprocess.run(
-                ['adb', '-s', self.master_device, 'shell', 'dumpsys', 'window', 'displays'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            output = result.stdout
-            width_match = re.search(r'mDisplayWidth=(\d+)', output)
-            height_match = re.search(r'mDisplayHeight=(\d+)', output)
+            result = self.controller.execute_command(self.master_device, 'dumpsys window displays')
+            if not result['success']:
+                raise RuntimeError(result['error'])
+            output = result['output']
+            width_match = _MDISP_W_RE.search(output)
+            height_match = _MDISP_H_RE.search(output)
             if width_match and height_match:
                 width = int(width_match.group(1))
-                height = int(height_match.group(2))
+                height = int(height_match.group(1))
                 size = {'width': width, 'height': height}
-                self.master_screen_size = size
+                self._set_master_size(size)
                 return size
         except Exception as e:
-            print(f"[ERROR] Failed to get master screen size: {e}")
+            logger.error("Failed to get master screen size: %s", e)
         return {'width': 0, 'height': 0}
 
 
@@ -441,12 +731,12 @@ class ActionMirror:
     def start_monitoring(self):
         """Start monitoring master device actions"""
         self.monitoring = True
-        print("Action mirroring started - monitoring master device...")
+        logger.info("Action mirroring started - monitoring master device...")
     
     def stop_monitoring(self):
         """Stop monitoring"""
         self.monitoring = False
-        print("Action mirroring stopped")
+        logger.info("Action mirroring stopped")
 
 
 class ScrcpyInputMirror:
@@ -458,37 +748,67 @@ class ScrcpyInputMirror:
         self.window_title = window_title
         self.mirror_thread = None
         self.running = False
+        # Set by stop_mirroring; the pynput thread blocks on it instead of polling self.running
+        self._stop_event = threading.Event()
         self.screen_controller = ScreenMirrorController(master_device, slave_devices)
         self.last_click_pos = None
         self.swipe_start = None
         self.swipe_active = False
+        # Cached scrcpy window handle and _MirrorGeometry, rebuilt when a move/resize marks it dirty
+        self._hwnd = None
+        self._geometry: Optional[_MirrorGeometry] = None
+        self._geometry_dirty = True
+        self._geometry_hook = None
+        # Master screen size is constant for the session
+        self._master_screen_size = None
+        self._getevent_process = None
+        # Wheel ticks accumulated until the pending _flush_scroll timer fires
+        self._scroll_lock = threading.Lock()
+        self._scroll_accum_dy = 0
+        self._scroll_pos = None
+        self._scroll_timer = None
         
     def start_mirroring(self):
         """Start intercepting and mirroring inputs"""
+        # Fetched once per session; event handlers read the cached value via _get_master_size()
+        self._master_screen_size = self.screen_controller.get_master_screen_size()
         try:
             import pynput
             self.pynput_available = True
         except ImportError:
-            print("WARNING: pynput not installed. Installing automatic input mirroring...")
-            print("For full automatic mirroring, install: pip install pynput")
-            print("Using alternative method: monitoring ADB events...")
+            logger.warning("pynput not installed. Installing automatic input mirroring...")
+            logger.info("For full automatic mirroring, install: pip install pynput")
+            logger.info("Using alternative method: monitoring ADB events...")
             self.pynput_available = False
             self._start_adb_monitoring()
             return
         
         self.running = True
+        self._stop_event.clear()
         self.mirror_thread = threading.Thread(target=self._monitor_with_pynput)
         self.mirror_thread.daemon = True
         self.mirror_thread.start()
-        print("[OK] Input mirroring thread started - monitoring for clicks on scrcpy window...")
-        print("  Click on the scrcpy window to test mirroring")
+        logger.info("[OK] Input mirroring thread started - monitoring for clicks on scrcpy window...")
+        logger.info("  Click on the scrcpy window to test mirroring")
     
     def stop_mirroring(self):
         """Stop input mirroring"""
         self.running = False
+        self._stop_event.set()
+        if self._geometry_hook:
+            self._geometry_hook.stop()
+            self._geometry_hook = None
+        scroll_timer = self._scroll_timer
+        if scroll_timer:
+            scroll_timer.cancel()
+        getevent_process = self._getevent_process
+        if getevent_process:
+            # Unblocks the getevent reader in _monitor_adb_events
+            getevent_process.terminate()
         if self.mirror_thread:
             self.mirror_thread.join(timeout=2)
-        print("Input mirroring stopped")
+        self.screen_controller.close()
+        logger.info("Input mirroring stopped")
     
     def _start_adb_monitoring(self):
         """Monitor ADB events from master device"""
@@ -496,240 +816,291 @@ class ScrcpyInputMirror:
         self.mirror_thread = threading.Thread(target=self._monitor_adb_events)
         self.mirror_thread.daemon = True
         self.mirror_thread.start()
-        print("[OK] ADB event monitoring active - mirroring master device inputs!")
+        logger.info("[OK] ADB event monitoring active - mirroring master device inputs!")
     
     def _monitor_adb_events(self):
         """Monitor ADB input events and mirror to slaves"""
-        import subprocess
-        import re
-        
-        print("[INFO] Starting ADB event monitoring (fallback method)")
-        print("[INFO] This method monitors touch events on the master device")
+        logger.info("Starting ADB event monitoring (fallback method)")
+        logger.info("This method monitors touch events on the master device")
         
         # Get screen size for coordinate conversion
-        screen_size = self.screen_controller.get_master_screen_size()
+        screen_size = self._get_master_size()
         if screen_size['width'] == 0:
             # Try to get it from ADB
             try:
-                result = subprocess.run(
-                    ['adb', '-s', self.master_device, 'shell', 'wm', 'size'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                match = re.search(r'(\d+)x(\d+)', result.stdout)
+                result = self.screen_controller.controller.execute_command(self.master_device, 'wm size')
+                match = _WM_SIZE_RE.search(result.get('output', ''))
                 if match:
                     screen_size['width'] = int(match.group(1))
                     screen_size['height'] = int(match.group(2))
-                    print(f"[INFO] Master screen size: {screen_size['width']}x{screen_size['height']}")
+                    logger.info("Master screen size: %sx%s", screen_size['width'], screen_size['height'])
             except Exception as e:
-                print(f"[ERROR] Could not get screen size: {e}")
+                logger.error("Could not get screen size: %s", e)
+        
+        if screen_size['width'] == 0 or screen_size['height'] == 0:
+            logger.error("Master screen size unknown - cannot mirror touch events")
+            return
         
-        # Alternative: Use a simpler approach - monitor for any input on master and mirror
-        # This is less precise but more reliable
-        print("[INFO] Monitoring master device for input events...")
-        print("[INFO] Note: This method may have delays. For better performance, install pynput.")
+        # Touches on the master already happened there, so they are mirrored to the slaves only
+        controller = self.screen_controller.controller
+        touch = controller.get_touch_range(self.master_device)
+        if not touch:
+            logger.error("Could not find the master touchscreen input device (getevent -pl)")
+            return
+        node = touch[0]
         
-        last_tap_time = 0
-        tap_cooldown = 0.3  # Prevent duplicate taps
+        def to_screen(raw):
+            # Panel axes are in the natural orientation; `input` coordinates follow the current rotation
+            return controller.touch_to_screen(self.master_device, raw[0], raw[1], screen_size)
         
-        while self.running:
-            try:
-                # Check if master device received any recent input
-                # We'll use a polling approach since getevent requires root
-                time.sleep(0.1)
-                
-                # For now, this is a placeholder - the pynput method is preferred
-                # In a production system, you'd parse getevent output here
-                
-            except Exception as e:
-                print(f"[ERROR] ADB monitoring error: {e}")
-                time.sleep(1)
+        # Stream kernel touch events instead of polling
+        logger.info("Monitoring master device for input events (%s)...", node)
+        self._getevent_process = subprocess.Popen(
+            ['adb', '-s', self.master_device, 'shell', 'getevent', '-lt', node],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1,
+            text=True,
+            creationflags=_CREATE_NO_WINDOW
+        )
+        
+        drag_threshold = 10  # Minimum pixels to consider it a drag
+        # Multi-touch protocol B: positions are reported per slot, only the first finger down is followed
+        slot = 0
+        positions = {}  # slot -> [raw_x, raw_y]
+        active_slot = None
+        pending_down = pending_up = False
+        start = None  # (x, y, timestamp) of the current touch
+        try:
+            for line in self._getevent_process.stdout:
+                if not self.running:
+                    break
+                match = _GETEVENT_LINE_RE.match(line)
+                if not match:
+                    continue
+                timestamp, code, value = match.groups()
+                if code == 'ABS_MT_SLOT':
+                    slot = int(value, 16)
+                elif code == 'ABS_MT_POSITION_X':
+                    positions.setdefault(slot, [None, None])[0] = int(value, 16)
+                elif code == 'ABS_MT_POSITION_Y':
+                    positions.setdefault(slot, [None, None])[1] = int(value, 16)
+                elif code == 'ABS_MT_TRACKING_ID':
+                    if value != 'ffffffff':
+                        if active_slot is None:
+                            active_slot = slot
+                            pending_down = True
+                    elif slot == active_slot:
+                        pending_up = True
+                elif active_slot is not None:
+                    # SYN_REPORT - one complete touch frame
+                    raw = positions.get(active_slot)
+                    if not raw or None in raw:
+                        continue
+                    if pending_down:
+                        pending_down = False
+                        x, y = to_screen(raw)
+                        start = (x, y, float(timestamp))
+                    if pending_up:
+                        pending_up = False
+                        active_slot = None
+                        x, y = to_screen(raw)
+                        x1, y1, t1 = start
+                        if abs(x - x1) > drag_threshold or abs(y - y1) > drag_threshold:
+                            duration = max(1, int((float(timestamp) - t1) * 1000))
+                            self.screen_controller.mirror_swipe(x1, y1, x, y, duration, include_master=False)
+                        else:
+                            self.screen_controller.mirror_tap(x1, y1, include_master=False)
+        except Exception as e:
+            if self.running:
+                logger.error("ADB monitoring error: %s", e)
+        finally:
+            self._getevent_process.terminate()
+            self._getevent_process = None
+    
+    def _queue_scroll(self, phone_x: int, phone_y: int, dy: int):
+        """Accumulate a wheel tick; ticks within 50ms are sent as one swipe"""
+        with self._scroll_lock:
+            self._scroll_accum_dy += dy
+            self._scroll_pos = (phone_x, phone_y)
+            if self._scroll_timer is None:
+                self._scroll_timer = threading.Timer(0.05, self._flush_scroll)
+                self._scroll_timer.daemon = True
+                self._scroll_timer.start()
+    
+    def _flush_scroll(self):
+        """Send the accumulated wheel ticks as a single swipe"""
+        with self._scroll_lock:
+            dy = self._scroll_accum_dy
+            phone_x, phone_y = self._scroll_pos
+            self._scroll_accum_dy = 0
+            self._scroll_timer = None
+        if not dy or not self.running:
+            return
+        # Note: dy > 0 means scrolling down, which should swipe down on phone
+        # Capped so a long momentum scroll stays one screen-sized swipe
+        dy = max(-5, min(5, dy))
+        swipe_distance = 300 * dy
+        max_y = max(self._get_master_size()['height'] - 1, 0)
+        start_y = max(0, min(max_y, phone_y - swipe_distance))
+        end_y = max(0, min(max_y, phone_y + swipe_distance))
+        self.screen_controller.mirror_swipe(phone_x, start_y, phone_x, end_y, 300)
+    
+    def _get_master_size(self) -> Dict:
+        """Master screen size (memoized once detected)"""
+        screen_size = self._master_screen_size
+        if not screen_size or screen_size['width'] == 0:
+            screen_size = self._master_screen_size = self.screen_controller.get_master_screen_size()
+        return screen_size
+    
+    def _on_window_event(self, event: int, hwnd: int):
+        """WinEvent hook callback - the scrcpy window moved, resized or closed"""
+        if hwnd != self._hwnd:
+            return
+        if event == _EVENT_OBJECT_DESTROY:
+            logger.warning("scrcpy window closed")
+            self._geometry = None
+        self._geometry_dirty = True
+    
+    def _install_geometry_hook(self, hwnd: int) -> bool:
+        """Watch the scrcpy window's process for close/location changes; False if the hook isn't available"""
+        if self._geometry_hook:
+            self._geometry_hook.stop()
+        try:
+            process_id = _window_process_id(hwnd)
+        except (AttributeError, OSError):
+            self._geometry_hook = None
+            return False
+        # DESTROY..LOCATIONCHANGE is one contiguous range; _on_window_event ignores anything but our window
+        self._geometry_hook = _WinEventHook(_EVENT_OBJECT_DESTROY, _EVENT_OBJECT_LOCATIONCHANGE,
+                                            self._on_window_event, process_id)
+        if not self._geometry_hook.active:
+            self._geometry_hook = None
+            return False
+        return True
+    
+    def _current_geometry(self) -> Optional[_MirrorGeometry]:
+        """Cached window geometry, recomputed first if the window moved (or is gone) since the last event"""
+        if self._geometry_dirty or self._geometry is None:
+            self._geometry_dirty = False
+            self._refresh_window_geometry()
+        return self._geometry
+    
+    def _refresh_window_geometry(self):
+        """Rebuild the cached window geometry if the scrcpy window moved/resized (re-find the window if it closed)"""
+        hwnd = self._hwnd
+        if not hwnd or not win32gui.IsWindow(hwnd):
+            hwnd = self._hwnd = _find_scrcpy_window(self.window_title)
+            if not hwnd:
+                if self._geometry is not None:
+                    logger.warning("scrcpy window not found - it may have closed")
+                self._geometry = None
+                return
+            if self._geometry_hook:
+                self._install_geometry_hook(hwnd)
+        try:
+            # Straight user32 calls into ctypes structs (no pywin32 tuple marshaling); locals, as the
+            # polling watcher and the listener thread can both be in here at once
+            user32 = ctypes.windll.user32
+            rect, point = wintypes.RECT(), wintypes.POINT()
+            if not user32.GetWindowRect(hwnd, ctypes.byref(rect)):
+                raise ctypes.WinError()
+            win_rect = (rect.left, rect.top, rect.right, rect.bottom)
+            screen_size = self._get_master_size()
+            geometry = self._geometry
+            if (geometry and geometry.win_rect == win_rect and
+                    geometry.phone_w == screen_size['width'] and geometry.phone_h == screen_size['height']):
+                return
+            # GetClientRect returns coordinates relative to client area (usually starts at 0,0)
+            if not user32.GetClientRect(hwnd, ctypes.byref(rect)):
+                raise ctypes.WinError()
+            client_width = rect.right - rect.left
+            client_height = rect.bottom - rect.top
+            point.x = point.y = 0
+            if user32.ClientToScreen(hwnd, ctypes.byref(point)):
+                client_screen_left, client_screen_top = point.x, point.y
+            else:
+                # Fallback: estimate title bar height
+                client_screen_left = win_rect[0]
+                client_screen_top = win_rect[1] + ((win_rect[3] - win_rect[1]) - client_height)
+            self._geometry = _MirrorGeometry(win_rect, client_screen_left, client_screen_top,
+                                             client_width, client_height,
+                                             screen_size['width'], screen_size['height'])
+        except Exception:
+            self._geometry = None
+    
+    def _watch_window_geometry(self):
+        """Keep the cached window geometry current while mirroring (fallback when the WinEvent hook is unavailable)"""
+        while not self._stop_event.wait(0.2):
+            self._refresh_window_geometry()
     
     def _monitor_with_pynput(self):
         """Monitor mouse and keyboard using pynput"""
         from pynput import mouse, keyboard
         
         if not WIN32_AVAILABLE:
-            print("WARNING: win32gui not available. Install pywin32: pip install pywin32")
-            print("Falling back to ADB monitoring...")
+            logger.warning("win32gui not available. Install pywin32: pip install pywin32")
+            logger.info("Falling back to ADB monitoring...")
             self._start_adb_monitoring()
             return
         
-        def get_scrcpy_window():
-            """Find scrcpy window handle"""
-            def enum_handler(hwnd, ctx):
-                if win32gui.IsWindowVisible(hwnd):
-                    title = win32gui.GetWindowText(hwnd)
-                    if self.window_title.lower() in title.lower() or 'scrcpy' in title.lower():
-                        ctx.append(hwnd)
-                return True
-            
-            windows = []
-            win32gui.EnumWindows(enum_handler, windows)
-            return windows[0] if windows else None
-        
-        def is_point_in_window(x, y, hwnd):
-            """Check if point is in window"""
-            if not hwnd:
-                return False
-            try:
-                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-                return left <= x <= right and top <= y <= bottom
-            except:
+        def is_point_in_window(x, y):
+            """Check if point is in the (cached) scrcpy window"""
+            geometry = self._current_geometry()
+            if geometry is None:
                 return False
+            # Plain comparison against the cached rect (right/bottom are exclusive, as in Win32 RECTs)
+            left, top, right, bottom = geometry.win_rect
+            return left <= x < right and top <= y < bottom
         
-        def get_window_size(hwnd):
-            """Get window size"""
-            try:
-                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
-                return right - left, bottom - top
-            except:
-                return 0, 0
-        
-        def convert_to_phone_coords(window_x, window_y, hwnd):
+        def convert_to_phone_coords(window_x, window_y):
             """Convert window coordinates to phone screen coordinates"""
-            screen_size = self.screen_controller.get_master_screen_size()
+            screen_size = self._get_master_size()
             if screen_size['width'] == 0 or screen_size['height'] == 0:
-                print(f"[WARNING] Could not get master screen size")
+                logger.warning("Could not get master screen size")
                 return None, None
             
-            try:
-                # Get window position and size
-                win_left, win_top, win_right, win_bottom = win32gui.GetWindowRect(hwnd)
-                win_width = win_right - win_left
-                win_height = win_bottom - win_top
-                
-                # Get client area (content area excluding borders/title bar)
-                # GetClientRect returns coordinates relative to client area (usually starts at 0,0)
-                client_left, client_top, client_right, client_bottom = win32gui.GetClientRect(hwnd)
-                client_width = client_right - client_left
-                client_height = client_bottom - client_top
-                
-                # Get the actual client area position on screen
-                # ClientToScreen converts client coordinates to screen coordinates
-                try:
-                    client_point = win32gui.ClientToScreen(hwnd, (0, 0))
-                    client_screen_left = client_point[0]
-                    client_screen_top = client_point[1]
-                except:
-                    # Fallback: estimate title bar height
-                    client_screen_left = win_left
-                    client_screen_top = win_top + (win_height - client_height)  # Approximate title bar
-                
-                # Convert absolute screen coordinates to client-relative coordinates
-                # window_x and window_y are absolute screen coordinates
-                rel_x = window_x - client_screen_left
-                rel_y = window_y - client_screen_top
-                
-                # Clamp to client area bounds
-                rel_x = max(0, min(rel_x, client_width))
-                rel_y = max(0, min(rel_y, client_height))
-                
-                # Scale to phone screen dimensions
-                if client_width > 0 and client_height > 0:
-                    # Calculate aspect ratios
-                    window_aspect = client_width / client_height if client_height > 0 else 0
-                    phone_aspect = screen_size['width'] / screen_size['height'] if screen_size['height'] > 0 else 0
-                    
-                    # Calculate scale factors
-                    scale_x = screen_size['width'] / client_width
-                    scale_y = screen_size['height'] / client_height
-                    
-                    # scrcpy maintains aspect ratio, so if aspect ratios don't match,
-                    # there will be letterboxing (black bars). We need to account for this.
-                    if abs(window_aspect - phone_aspect) > 0.01:  # Aspect ratio mismatch
-                        # Use uniform scaling (scrcpy will letterbox to maintain aspect ratio)
-                        scale = min(scale_x, scale_y)
-                        
-                        # Calculate the actual visible content area (excluding letterboxing)
-                        if window_aspect > phone_aspect:
-                            # Window is wider - letterboxing on sides (vertical bars)
-                            # Content is centered horizontally
-                            visible_width = int(client_height * phone_aspect)
-                            letterbox_x = (client_width - visible_width) // 2
-                            
-                            # Adjust relative X to account for letterboxing
-                            if rel_x < letterbox_x or rel_x > (letterbox_x + visible_width):
-                                # Clicked in letterbox area - return None to ignore
-                                return None, None
-                            
-                            # Map to visible content area
-                            content_x = rel_x - letterbox_x
-                            phone_x = int(content_x * scale)
-                            phone_y = int(rel_y * scale)
-                        else:
-                            # Window is taller - letterboxing on top/bottom (horizontal bars)
-                            # Content is centered vertically
-                            visible_height = int(client_width / phone_aspect)
-                            letterbox_y = (client_height - visible_height) // 2
-                            
-                            # Adjust relative Y to account for letterboxing
-                            if rel_y < letterbox_y or rel_y > (letterbox_y + visible_height):
-                                # Clicked in letterbox area - return None to ignore
-                                return None, None
-                            
-                            # Map to visible content area
-                            content_y = rel_y - letterbox_y
-                            phone_x = int(rel_x * scale)
-                            phone_y = int(content_y * scale)
-                    else:
-                        # Aspect ratios match - use direct scaling (no letterboxing)
-                        phone_x = int(rel_x * scale_x)
-                        phone_y = int(rel_y * scale_y)
-                    
-                    # Clamp to phone screen bounds (safety check)
-                    phone_x = max(0, min(phone_x, screen_size['width'] - 1))
-                    phone_y = max(0, min(phone_y, screen_size['height'] - 1))
-                    
-                    # Debug output - show detailed info for troubleshooting
-                    # Only show if coordinates seem off (near edges or if verbose mode)
-                    show_debug = (rel_y > client_height * 0.9 or rel_y < client_height * 0.1 or 
-                                 rel_x < client_width * 0.1 or rel_x > client_width * 0.9)
-                    if show_debug:
-                        print(f"[DEBUG] screen({window_x}, {window_y}) -> rel({rel_x:.0f}, {rel_y:.0f}) -> phone({phone_x}, {phone_y})")
-                        print(f"[DEBUG]   Client offset: ({client_screen_left - win_left}, {client_screen_top - win_top})")
-                        print(f"[DEBUG]   Scale: ({scale_x:.3f}, {scale_y:.3f}), Client: {client_width}x{client_height}")
-                    
-                    return phone_x, phone_y
-                else:
-                    print(f"[ERROR] Invalid client area: {client_width}x{client_height}")
-                    return None, None
-                    
-            except Exception as e:
-                print(f"[ERROR] Coordinate conversion failed: {e}")
-                # Fallback: simple scaling using window size
-                try:
-                    win_left, win_top, win_right, win_bottom = win32gui.GetWindowRect(hwnd)
-                    rel_x = window_x - win_left
-                    rel_y = window_y - win_top
-                    win_width = win_right - win_left
-                    win_height = win_bottom - win_top
-                    
-                    if win_width > 0 and win_height > 0:
-                        scale_x = screen_size['width'] / win_width
-                        scale_y = screen_size['height'] / win_height
-                        phone_x = int(rel_x * scale_x)
-                        phone_y = int(rel_y * scale_y)
-                        return max(0, min(phone_x, screen_size['width'])), max(0, min(phone_y, screen_size['height']))
-                except:
-                    pass
+            geometry = self._current_geometry()
+            if not geometry:
                 return None, None
+            if not geometry.valid:
+                logger.error("Invalid client area: %dx%d", geometry.client_width, geometry.client_height)
+                return None, None
+            
+            # Convert absolute screen coordinates to client-relative coordinates, clamped to the client area
+            rel_x = max(0, min(window_x - geometry.client_screen_left, geometry.client_width))
+            rel_y = max(0, min(window_y - geometry.client_screen_top, geometry.client_height))
+            
+            # Scale to phone screen dimensions (None if clicked in the letterbox area)
+            phone_x, phone_y = geometry.to_phone(rel_x, rel_y)
+            if phone_x is None:
+                return None, None
+            
+            # Debug output - show detailed info for troubleshooting
+            # Only show at DEBUG level (e.g. main.py --verbose), and only if coordinates seem off (near edges)
+            if logger.isEnabledFor(logging.DEBUG):
+                client_width = geometry.client_width
+                client_height = geometry.client_height
+                show_debug = (rel_y > client_height * 0.9 or rel_y < client_height * 0.1 or 
+                             rel_x < client_width * 0.1 or rel_x > client_width * 0.9)
+                if show_debug:
+                    win_left, win_top = geometry.win_rect[0], geometry.win_rect[1]
+                    logger.debug("screen(%d, %d) -> rel(%.0f, %.0f) -> phone(%d, %d)",
+                                 window_x, window_y, rel_x, rel_y, phone_x, phone_y)
+                    logger.debug("  Client offset: (%d, %d)",
+                                 geometry.client_screen_left - win_left, geometry.client_screen_top - win_top)
+                    logger.debug("  Scale: (%.3f, %.3f), Client: %dx%d",
+                                 geometry.scale_x, geometry.scale_y, client_width, client_height)
+            
+            return phone_x, phone_y
         
-        # Wait for scrcpy window to appear - try multiple times
-        hwnd = None
-        max_attempts = 100  # Wait up to 10 seconds
-        for attempt in range(max_attempts):
-            hwnd = get_scrcpy_window()
-            if hwnd:
-                break
-            if attempt % 10 == 0:  # Print status every second
-                print(f"[INFO] Waiting for scrcpy window... ({attempt/10:.0f}s)")
-            time.sleep(0.1)
+        # Wait up to 10 seconds for scrcpy window to appear
+        logger.info("Waiting for scrcpy window...")
+        hwnd = _wait_for_scrcpy_window(self.window_title, timeout=10)
         
         if not hwnd:
-            print("[WARNING] Could not find scrcpy window with expected title.")
-            print("[WARNING] Looking for ANY scrcpy window...")
+            logger.warning("Could not find scrcpy window with expected title.")
+            logger.warning("Looking for ANY scrcpy window...")
             # Try to find any window with scrcpy
             def find_any_scrcpy(hwnd, ctx):
                 if win32gui.IsWindowVisible(hwnd):
@@ -740,44 +1111,51 @@ class ScrcpyInputMirror:
             all_windows = []
             win32gui.EnumWindows(find_any_scrcpy, all_windows)
             if all_windows:
-                print(f"[INFO] Found {len(all_windows)} scrcpy window(s):")
+                logger.info("Found %s scrcpy window(s):", len(all_windows))
                 for h, t in all_windows:
-                    print(f"  - '{t}' (handle: {h})")
+                    logger.info("  - '%s' (handle: %s)", t, h)
                 # Use the first one found
                 hwnd = all_windows[0][0]
-                print(f"[INFO] Using first window found: '{all_windows[0][1]}'")
+                logger.info("Using first window found: '%s'", all_windows[0][1])
             else:
-                print("[ERROR] No scrcpy windows found at all!")
-                print("[ERROR] Make sure scrcpy is running and the window is visible.")
-                print("[ERROR] Input mirroring will not work until scrcpy window is detected.")
+                logger.error("No scrcpy windows found at all!")
+                logger.error("Make sure scrcpy is running and the window is visible.")
+                logger.error("Input mirroring will not work until scrcpy window is detected.")
                 return
         else:
             window_title = win32gui.GetWindowText(hwnd)
-            print(f"[SUCCESS] Found scrcpy window: '{window_title}' (handle: {hwnd})")
+            logger.info("[SUCCESS] Found scrcpy window: '%s' (handle: %s)", window_title, hwnd)
+        
+        # Cache the handle and geometry; a location-change hook marks them dirty from here on
+        self._hwnd = hwnd
+        self._refresh_window_geometry()
+        self._geometry_dirty = False
+        if not self._install_geometry_hook(hwnd):
+            logger.info("Window event hook unavailable - polling window geometry instead")
+            threading.Thread(target=self._watch_window_geometry, daemon=True).start()
         
         # Get window info for debugging
         try:
-            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            left, top, right, bottom = self._geometry.win_rect
+            client_width = self._geometry.client_width
+            client_height = self._geometry.client_height
             width = right - left
             height = bottom - top
-            client_left, client_top, client_right, client_bottom = win32gui.GetClientRect(hwnd)
-            client_width = client_right - client_left
-            client_height = client_bottom - client_top
-            print(f"[INFO] Window: {width}x{height} at ({left}, {top}), Client: {client_width}x{client_height}")
+            logger.info("Window: %sx%s at (%s, %s), Client: %sx%s", width, height, left, top, client_width, client_height)
             
             # Get and display phone screen size
-            screen_size = self.screen_controller.get_master_screen_size()
+            screen_size = self._get_master_size()
             if screen_size['width'] > 0:
                 window_aspect = client_width / client_height if client_height > 0 else 0
                 phone_aspect = screen_size['width'] / screen_size['height'] if screen_size['height'] > 0 else 0
-                print(f"[INFO] Master phone screen: {screen_size['width']}x{screen_size['height']}")
-                print(f"[INFO] Aspect ratios - Window: {window_aspect:.3f}, Phone: {phone_aspect:.3f}")
+                logger.info("Master phone screen: %sx%s", screen_size['width'], screen_size['height'])
+                logger.info("Aspect ratios - Window: %.3f, Phone: %.3f", window_aspect, phone_aspect)
                 if abs(window_aspect - phone_aspect) > 0.01:
-                    print(f"[INFO] Aspect ratio mismatch detected - using uniform scaling")
+                    logger.info("Aspect ratio mismatch detected - using uniform scaling")
             else:
-                print(f"[WARNING] Could not detect master phone screen size - coordinate conversion may fail")
+                logger.warning("Could not detect master phone screen size - coordinate conversion may fail")
         except Exception as e:
-            print(f"[WARNING] Could not get window info: {e}")
+            logger.warning("Could not get window info: %s", e)
         
         # Track mouse drag state
         drag_start = None
@@ -790,23 +1168,20 @@ class ScrcpyInputMirror:
             if not self.running:
                 return False
             
-            if not hwnd:
-                return True  # Continue listening even if window not found
-            
-            if is_point_in_window(x, y, hwnd):
+            # Continues listening even if the window is not found (it is re-found on the next click)
+            if is_point_in_window(x, y):
                 if button == mouse.Button.left:
                     if pressed:
                         # Mouse down - start drag
-                        phone_x, phone_y = convert_to_phone_coords(x, y, hwnd)
+                        phone_x, phone_y = convert_to_phone_coords(x, y)
                         if phone_x is not None and phone_y is not None:
                             drag_start = (phone_x, phone_y)
                             drag_active = True
-                            screen_size = self.screen_controller.get_master_screen_size()
-                            print(f"[DEBUG] Mouse down: screen({x}, {y}) -> phone({phone_x}, {phone_y})")
+                            logger.debug("Mouse down: screen(%d, %d) -> phone(%d, %d)", x, y, phone_x, phone_y)
                     else:
                         # Mouse up - end drag or tap
                         if drag_active and drag_start:
-                            phone_x, phone_y = convert_to_phone_coords(x, y, hwnd)
+                            phone_x, phone_y = convert_to_phone_coords(x, y)
                             if phone_x is not None and phone_y is not None:
                                 # Check if this was a drag (moved more than threshold)
                                 dx = abs(phone_x - drag_start[0])
@@ -815,7 +1190,8 @@ class ScrcpyInputMirror:
                                 
                                 if dx > drag_threshold or dy > drag_threshold:
                                     # This was a drag - send swipe command
-                                    print(f"[DEBUG] Drag: ({drag_start[0]}, {drag_start[1]}) -> ({phone_x}, {phone_y})")
+                                    logger.debug("Drag: (%d, %d) -> (%d, %d)",
+                                                 drag_start[0], drag_start[1], phone_x, phone_y)
                                     self.screen_controller.mirror_swipe(
                                         drag_start[0], drag_start[1],
                                         phone_x, phone_y,
@@ -823,15 +1199,14 @@ class ScrcpyInputMirror:
                                     )
                                 else:
                                     # This was just a tap
-                                    screen_size = self.screen_controller.get_master_screen_size()
-                                    print(f"[DEBUG] Tap: screen({x}, {y}) -> phone({phone_x}, {phone_y})")
+                                    logger.debug("Tap: screen(%d, %d) -> phone(%d, %d)", x, y, phone_x, phone_y)
                                     self.screen_controller.mirror_tap(phone_x, phone_y)
                             
                             drag_start = None
                             drag_active = False
                 elif pressed and button == mouse.Button.right:
                     # Right click = back button
-                    print(f"[DEBUG] Right-click detected - sending BACK key")
+                    logger.debug("Right-click detected - sending BACK key")
                     self.screen_controller.mirror_key("KEYCODE_BACK")
             else:
                 # Click outside window - cancel drag
@@ -844,60 +1219,29 @@ class ScrcpyInputMirror:
             if not self.running:
                 return False
             
-            if hwnd and is_point_in_window(x, y, hwnd):
-                phone_x, phone_y = convert_to_phone_coords(x, y, hwnd)
-                if phone_x is not None and phone_y is not None:
-                    # Convert scroll to swipe
-                    # Note: dy > 0 means scrolling down, which should swipe down on phone
-                    swipe_distance = 300
-                    if dy > 0:  # Scroll down = swipe down (FIXED)
-                        self.screen_controller.mirror_swipe(
-                            phone_x, phone_y - swipe_distance,
-                            phone_x, phone_y + swipe_distance,
-                            300
-                        )
-                    elif dy < 0:  # Scroll up = swipe up (FIXED)
-                        self.screen_controller.mirror_swipe(
-                            phone_x, phone_y + swipe_distance,
-                            phone_x, phone_y - swipe_distance,
-                            300
-                        )
-        
-        def on_move(x, y):
-            """Handle mouse movement (for drag tracking)"""
-            nonlocal drag_start, drag_active
-            # We don't need to do anything on move - drag is handled on mouse up
-            # But we can use this to update drag end position if needed
-            pass
+            if is_point_in_window(x, y):
+                phone_x, phone_y = convert_to_phone_coords(x, y)
+                if phone_x is not None and phone_y is not None and dy:
+                    # Convert scroll to swipe (coalesced with the ticks that follow)
+                    self._queue_scroll(phone_x, phone_y, dy)
         
         # Start mouse listener
-        print("[INFO] Starting mouse listener...")
+        logger.info("Starting mouse listener...")
+        # No on_move: drags are resolved on mouse up, and pynput skips move events without a callback
         mouse_listener = mouse.Listener(
             on_click=on_click,
-            on_scroll=on_scroll,
-            on_move=on_move
+            on_scroll=on_scroll
         )
         mouse_listener.start()
-        print("[SUCCESS] Mouse listener active! Click on the scrcpy window to test.")
-        print("[INFO] Listening for clicks... (Press Ctrl+C in main script to stop)")
+        logger.info("[SUCCESS] Mouse listener active! Click on the scrcpy window to test.")
+        logger.info("Listening for clicks... (Press Ctrl+C in main script to stop)")
         
-        # Keep running and periodically check window still exists
-        check_count = 0
-        while self.running:
-            time.sleep(0.1)
-            check_count += 1
-            # Every 5 seconds, verify window still exists
-            if check_count % 50 == 0:
-                current_hwnd = get_scrcpy_window()
-                if not current_hwnd and hwnd:
-                    # Window might have closed, try to find it again
-                    hwnd = get_scrcpy_window()
-                    if not hwnd:
-                        print("[WARNING] scrcpy window not found - it may have closed")
-        
-        print("[INFO] Stopping mouse listener...")
+        # Keep running until stop_mirroring (a closed window is re-found on the next click)
+        self._stop_event.wait()
+        
+        logger.info("Stopping mouse listener...")
         mouse_listener.stop()
-        print("[INFO] Mouse listener stopped")
+        logger.info("Mouse listener stopped")
 
 
 class MasterSlaveController:
@@ -912,26 +1256,24 @@ class MasterSlaveController:
         
     def start(self, window_title: str = "Phone Master - Control Here"):
         """Start complete system"""
-        print("=== Starting Master-Slave Control System ===\n")
+        logger.info("=== Starting Master-Slave Control System ===\n")
         
         self.window_title = window_title
         
         # Start screen mirroring
         if not self.screen_controller.start_screen_mirror(window_title):
-            print("Failed to start screen mirroring!")
+            logger.error("Failed to start screen mirroring!")
             return False
         
-        time.sleep(2)
-        
         # Create and start input mirroring
         self.input_mirror = ScrcpyInputMirror(self.master_device, self.slave_devices, window_title)
         self.input_mirror.start_mirroring()
         
-        print("\n[OK] System ready!")
-        print(f"  Master: {self.master_device}")
-        print(f"  Slaves: {len(self.slave_devices)} devices")
-        print("\nControl the master phone window - actions will mirror to all slaves!")
-        print("Press Ctrl+C to stop...")
+        logger.info("\n[OK] System ready!")
+        logger.info("  Master: %s", self.master_device)
+        logger.info("  Slaves: %s devices", len(self.slave_devices))
+        logger.info("\nControl the master phone window - actions will mirror to all slaves!")
+        logger.info("Press Ctrl+C to stop...")
         
         return True
     
@@ -939,8 +1281,8 @@ class MasterSlaveController:
         """Stop all systems"""
         if self.input_mirror:
             self.input_mirror.stop_mirroring()
-        self.screen_controller.stop_screen_mirror()
-        print("\nSystem stopped")
+        self.screen_controller.close()
+        logger.info("\nSystem stopped")
     
     def manual_mirror_tap(self, x: int, y: int):
         """Manually trigger tap mirroring"""
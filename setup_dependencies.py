@@ -14,6 +14,16 @@ def install_package(package):
         print(f"✗ Failed to install {package}")
         return False
 
+def install_packages(packages):
+    """Install several Python packages with a single pip run"""
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+        print(f"✓ Successfully installed {', '.join(packages)}")
+        return True
+    except subprocess.CalledProcessError:
+        print("✗ Batch install failed - installing packages one by one")
+        return False
+
 def main():
     print("=" * 60)
     print("  Installing Dependencies for Input Mirroring")
@@ -33,12 +43,19 @@ def main():
     input("Press Enter to continue or Ctrl+C to cancel...")
     print()
     
-    success_count = 0
-    for package in packages:
-        print(f"Installing {package}...")
-        if install_package(package):
-            success_count += 1
+    # One pip startup for everything; per-package installs only to find out which one failed
+    print("Installing packages...")
+    if install_packages(packages):
+        success_count = len(packages)
+        print()
+    else:
         print()
+        success_count = 0
+        for package in packages:
+            print(f"Installing {package}...")
+            if install_package(package):
+                success_count += 1
+            print()
     
     print("=" * 60)
     if success_count == len(packages):
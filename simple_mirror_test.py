@@ -4,8 +4,11 @@ Simple test to verify mirroring works - bypasses window detection
 import subprocess
 import sys
 from screen_mirror_controller import ScreenMirrorController
+from phone_controller import configure_logging
 
 def main():
+    configure_logging()
+    
     print("=" * 60)
     print("  Simple Mirror Test - Direct Command Test")
     print("=" * 60)
@@ -21,8 +24,8 @@ def main():
         )
         
         devices = []
-        for line in result.stdout.strip().split('\n')[1:]:
-            if line.strip() and '\tdevice' in line:
+        for line in result.stdout.splitlines()[1:]:
+            if line.endswith('\tdevice'):
                 device_id = line.split('\t')[0]
                 devices.append(device_id)
         
@@ -60,6 +63,9 @@ def main():
         controller.mirror_swipe(500, 1500, 500, 500, 300)
         print()
         
+        # Lets the queued input reach the devices before the shells close
+        controller.close()
+        
         print("=" * 60)
         print("Tests complete!")
         print("=" * 60)
@@ -2,29 +2,43 @@ import subprocess
 import time
 import socket
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
+# wlan0 address in `ip addr show` output (matched on the raw bytes)
+_INET_RE = re.compile(rb'inet (\d+\.\d+\.\d+\.\d+)')
+
 class WiFiADBManager:
     def __init__(self):
         self.devices = []
         self.master_device = None
         self.slave_devices = []
+        # (monotonic timestamp, device ids) of the last `adb devices` listing
+        self._devices_cache = (0.0, [])
+    
+    def _list_all_devices(self) -> List[str]:
+        """Ids of all devices in the `adb devices` table (cached for 0.5s)"""
+        timestamp, devices = self._devices_cache
+        if time.monotonic() - timestamp < 0.5:
+            return devices
+        result = subprocess.run(
+            ['adb', 'devices'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        devices = []
+        for line in result.stdout.splitlines()[1:]:
+            if line.endswith('\tdevice'):
+                devices.append(line.split('\t')[0])
+        self._devices_cache = (time.monotonic(), devices)
+        return devices
     
     def get_usb_devices(self) -> List[str]:
         """Get devices connected via USB (for initial WiFi setup)"""
         try:
-            result = subprocess.run(
-                ['adb', 'devices'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            devices = []
-            for line in result.stdout.strip().split('\n')[1:]:
-                if line.strip() and '\tdevice' in line:
-                    device_id = line.split('\t')[0]
-                    devices.append(device_id)
-            return devices
+            # WiFi devices have IP:PORT format
+            return [device_id for device_id in self._list_all_devices() if ':' not in device_id]
         except Exception as e:
             print(f"Error getting USB devices: {e}")
             return []
@@ -35,13 +49,12 @@ class WiFiADBManager:
             result = subprocess.run(
                 ['adb', '-s', device_id, 'shell', 'ip', 'addr', 'show', 'wlan0'],
                 capture_output=True,
-                text=True,
                 check=True
             )
             # Extract IP from output
-            match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', result.stdout)
+            match = _INET_RE.search(result.stdout)
             if match:
-                return match.group(1)
+                return match.group(1).decode('ascii')
         except Exception as e:
             print(f"Error getting IP for {device_id}: {e}")
         return None
@@ -58,7 +71,8 @@ class WiFiADBManager:
             subprocess.run(
                 ['adb', '-s', device_id, 'tcpip', str(port)],
                 check=True,
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             time.sleep(2)
             
@@ -69,6 +83,8 @@ class WiFiADBManager:
                 text=True,
                 check=True
             )
+            # The device table changed
+            self._devices_cache = (0.0, [])
             
             if 'connected' in result.stdout.lower():
                 print(f"[OK] Connected {device_id} via WiFi at {ip}:{port}")
@@ -88,31 +104,18 @@ class WiFiADBManager:
             return []
         
         print(f"Found {len(usb_devices)} USB device(s). Connecting via WiFi...")
-        connected = []
         
-        for device_id in usb_devices:
-            if self.connect_device_wifi(device_id, port):
-                connected.append(device_id)
-            time.sleep(1)
+        # Each device waits for its own tcpip restart, so connect them all at once
+        with ThreadPoolExecutor(max_workers=len(usb_devices)) as pool:
+            results = list(pool.map(lambda device_id: self.connect_device_wifi(device_id, port), usb_devices))
         
-        return connected
+        return [device_id for device_id, ok in zip(usb_devices, results) if ok]
     
     def get_wifi_devices(self) -> List[str]:
         """Get all devices connected via WiFi"""
         try:
-            result = subprocess.run(
-                ['adb', 'devices'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            wifi_devices = []
-            for line in result.stdout.strip().split('\n')[1:]:
-                if line.strip() and '\tdevice' in line:
-                    device_id = line.split('\t')[0]
-                    if ':' in device_id:  # WiFi devices have IP:PORT format
-                        wifi_devices.append(device_id)
-            return wifi_devices
+            # WiFi devices have IP:PORT format
+            return [device_id for device_id in self._list_all_devices() if ':' in device_id]
         except Exception as e:
             print(f"Error getting WiFi devices: {e}")
             return []
@@ -133,6 +136,7 @@ class WiFiADBManager:
         for device in devices:
             try:
                 subprocess.run(['adb', 'disconnect', device], check=True)
+                self._devices_cache = (0.0, [])
                 print(f"Disconnected {device}")
             except:
                 pass